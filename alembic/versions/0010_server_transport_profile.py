@@ -0,0 +1,31 @@
+"""Añade columna transport_profile a tabla servers.
+
+Revision ID: 0010_server_transport_profile
+Revises: 0009_user_role
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0010_server_transport_profile"
+down_revision: str | None = "0009_user_role"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    """Añade columna transport_profile a servers con valor por defecto 'default'."""
+    op.add_column(
+        "servers",
+        sa.Column(
+            "transport_profile",
+            sa.String(20),
+            nullable=False,
+            server_default="default",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Elimina columna transport_profile de servers."""
+    op.drop_column("servers", "transport_profile")
@@ -50,5 +50,27 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://0.0.0.0:3000"]
 
+    # Pool de conexiones SSH (ADR-003, RNF-03)
+    SSH_POOL_IDLE_TIMEOUT_SECONDS: int = 300
+    SSH_POOL_MAX_CONNECTIONS_PER_HOST: int = 5
+    # Canales concurrentes por conexión — no superar MaxSessions de sshd (default 10)
+    SSH_POOL_MAX_CHANNELS_PER_CONNECTION: int = 10
+    # Llamantes en cola a partir de los cuales se abre otra conexión al mismo host
+    SSH_POOL_SPILL_QUEUE_THRESHOLD: int = 4
+
+    # Governor de handshakes SSH: límite global (con rampa desde RAMP_START) y por host
+    SSH_CONNECT_MAX_CONCURRENT: int = 32
+    SSH_CONNECT_MAX_PER_HOST: int = 4
+    SSH_CONNECT_RAMP_START: int = 8
+
+    # Circuit breaker por servidor (estado compartido en Valkey)
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 3
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS: int = 60
+    CIRCUIT_BREAKER_FAILURE_WINDOW_SECONDS: int = 300
+
+    # Caché de credenciales descifradas de ConnectionFactory
+    CREDENTIAL_CACHE_TTL_SECONDS: int = 60
+    CREDENTIAL_CACHE_MAX_ENTRIES: int = 1024
+
     # Cifrado AES-256-GCM para credenciales en reposo (exactamente 32 bytes ASCII)
     ENCRYPTION_KEY: str = "dev-only-key-change-in-prod-0000"
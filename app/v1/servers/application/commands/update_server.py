@@ -11,7 +11,8 @@ from app.v1.shared.application.interfaces.event_bus import EventBus
 class UpdateServer:
     """Use Case para actualizar un servidor existente.
 
-    Para servidores remote: permite actualizar name, host, port, credential_id y description.
+    Para servidores remote: permite actualizar name, host, port, credential_id, description
+    y transport_profile.
     Para servidores local: solo permite actualizar name y description (RNF-16).
     """
 
@@ -33,6 +34,7 @@ class UpdateServer:
         credential_id: str | None,
         description: str | None,
         correlation_id: str,
+        transport_profile: str | None = None,
     ) -> ServerResult:
         """Actualiza un servidor existente.
 
@@ -45,12 +47,14 @@ class UpdateServer:
             credential_id: Nueva credencial (solo aplica a remote)
             description: Nueva descripción opcional
             correlation_id: ID de trazabilidad del request
+            transport_profile: Nuevo perfil de transporte SSH (solo aplica a remote)
 
         Returns:
             ServerResult con los datos actualizados
 
         Raises:
             ServerNotFoundError: Si el servidor no existe o no pertenece al usuario (RN-01)
+            InvalidTransportProfileError: Si el perfil no es default, lan ni wan
         """
         server = None
         if self._server_repo is not None:
@@ -67,6 +71,7 @@ class UpdateServer:
             host=host,
             port=port,
             credential_id=credential_id,
+            transport_profile=transport_profile,
         )
 
         if self._server_repo is not None:
@@ -95,6 +100,7 @@ class UpdateServer:
             os_id=server.os_id,
             os_version=server.os_version,
             os_name=server.os_name,
+            transport_profile=server.transport_profile.value,
             created_at=server.created_at,
             updated_at=server.updated_at,
         )
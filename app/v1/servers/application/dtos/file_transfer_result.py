@@ -0,0 +1,13 @@
+"""DTO para el resultado de transferir un archivo en una subida múltiple."""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FileTransferResult:
+    """Resultado por archivo de Connection.upload_many()."""
+
+    local_path: str
+    remote_path: str
+    success: bool
+    bytes_transferred: int = 0
+    error: str | None = None
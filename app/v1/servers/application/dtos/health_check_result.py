@@ -12,3 +12,5 @@ class HealthCheckResult:
     os_id: str | None
     os_version: str | None
     os_name: str | None
+    # Estado del circuit breaker si el check se cortó sin conectar ("open" | "half_open")
+    circuit_state: str | None = None
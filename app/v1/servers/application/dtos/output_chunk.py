@@ -0,0 +1,16 @@
+"""DTO para un fragmento de salida emitido por Connection.stream()."""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class OutputChunk:
+    """Fragmento ordenado de la salida de un comando en ejecución.
+
+    `stream` indica el origen: "stdout", "stderr" o "exit". El último fragmento
+    de un stream siempre es "exit", sin datos y con el exit_code del comando.
+    """
+
+    seq: int
+    stream: str  # "stdout" | "stderr" | "exit"
+    data: str
+    exit_code: int | None = None
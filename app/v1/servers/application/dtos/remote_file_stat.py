@@ -0,0 +1,17 @@
+"""DTO con el estado de un path remoto devuelto por Connection.stat_many()."""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RemoteFileStat:
+    """Existencia, tamaño, mtime y (opcional) SHA-256 de un path remoto.
+
+    size, mtime y sha256 son None si el path no existe o no se pudieron leer.
+    sha256 solo se calcula para archivos regulares cuando se pide.
+    """
+
+    path: str
+    exists: bool
+    size: int | None = None
+    mtime: float | None = None
+    sha256: str | None = None
@@ -28,3 +28,4 @@ class ServerResult:
     os_name: str | None
     created_at: datetime
     updated_at: datetime
+    transport_profile: str = "default"
@@ -29,3 +29,16 @@ class GroupInUseError(UseCaseException):
 
 class LocalServerNotAllowedInGroupError(UseCaseException):
     """No se puede añadir un servidor local a un grupo (RNF-16)."""
+
+
+class ServerCircuitOpenError(UseCaseException):
+    """El circuit breaker del servidor está abierto: se rechaza sin intentar conectar."""
+
+    def __init__(self, server_id: str, retry_after: int, state: str = "open") -> None:
+        super().__init__(
+            f"Servidor '{server_id}' no disponible: circuit breaker {state} "
+            f"(reintentar en {retry_after}s)"
+        )
+        self.server_id = server_id
+        self.retry_after = retry_after
+        self.state = state
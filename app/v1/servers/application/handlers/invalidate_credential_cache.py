@@ -0,0 +1,27 @@
+"""Handler: invalida la caché de credenciales cuando una credencial cambia o se elimina."""
+from app.v1.shared.application.interfaces.event_bus import EventHandler
+from app.v1.shared.domain.events import DomainEvent
+from app.v1.servers.application.interfaces.credential_cache import CredentialCache
+
+
+class InvalidateCredentialCacheOnCredentialChanged(EventHandler):
+    """
+    Escucha CredentialUpdated y CredentialDeleted y descarta la entrada cacheada.
+
+    Evita que la ConnectionFactory siga usando secretos o claves ya parseadas
+    de una versión anterior de la credencial.
+
+    Es idempotente: invalidar una credencial que no está en caché no hace nada.
+    """
+
+    def __init__(self, credential_cache: CredentialCache) -> None:
+        self._cache = credential_cache
+
+    async def handle(self, event: DomainEvent) -> None:
+        """
+        Procesa el evento CredentialUpdated o CredentialDeleted.
+
+        Args:
+            event: Evento de dominio con payload {"credential_id": str, "user_id": str}
+        """
+        self._cache.invalidate(event.payload["credential_id"])
@@ -0,0 +1,60 @@
+"""
+Interface para el circuit breaker de conexiones a servidores.
+
+Define el contrato que será implementado en infrastructure/services/.
+"""
+from abc import ABC, abstractmethod
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker(ABC):
+    """Contrato del circuit breaker por servidor (closed → open → half_open)."""
+
+    @abstractmethod
+    async def before_call(self, server_id: str) -> None:
+        """
+        Comprueba si se puede intentar conectar al servidor.
+
+        En half_open solo deja pasar una sonda a la vez.
+
+        Args:
+            server_id: ID del servidor
+
+        Raises:
+            ServerCircuitOpenError: Si el breaker está abierto o ya hay una sonda en curso
+        """
+
+    @abstractmethod
+    async def record_success(self, server_id: str) -> None:
+        """
+        Registra un connect correcto: cierra el breaker y resetea los fallos.
+
+        Args:
+            server_id: ID del servidor
+        """
+
+    @abstractmethod
+    async def record_failure(self, server_id: str) -> None:
+        """
+        Registra un connect fallido por red/timeout.
+
+        Abre el breaker al alcanzar el umbral, o lo reabre si falla la sonda.
+
+        Args:
+            server_id: ID del servidor
+        """
+
+    @abstractmethod
+    async def get_state(self, server_id: str) -> str:
+        """
+        Devuelve el estado actual del breaker.
+
+        Args:
+            server_id: ID del servidor
+
+        Returns:
+            "closed", "open" o "half_open"
+        """
@@ -5,6 +5,13 @@ Define el contrato que será implementado por los adaptadores concretos
 (asyncssh, paramiko, etc.) en infrastructure/adapters/.
 """
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from contextlib import AbstractAsyncContextManager
+
+from app.v1.servers.application.dtos.file_transfer_result import FileTransferResult
+from app.v1.servers.application.dtos.output_chunk import OutputChunk
+from app.v1.servers.application.dtos.remote_file_stat import RemoteFileStat
+from app.v1.servers.application.interfaces.shell_session import ShellSession
 
 
 class Connection(ABC):
@@ -28,6 +35,51 @@ class Connection(ABC):
             TimeoutError: Si el comando supera el timeout
         """
 
+    @abstractmethod
+    def stream(
+        self, command: str, sudo: bool = False, timeout: int = 30
+    ) -> AsyncIterator[OutputChunk]:
+        """
+        Ejecuta un comando y emite su salida a medida que se produce.
+
+        Los fragmentos llegan en orden de llegada, etiquetados como stdout o
+        stderr y numerados con `seq`. El último fragmento es siempre "exit" con
+        el exit_code. La salida no se acumula: si el consumidor deja de iterar,
+        la lectura se detiene (backpressure) y el comando remoto se bloquea.
+
+        Args:
+            command: Comando a ejecutar
+            sudo: Si True, ejecuta con sudo
+            timeout: Tiempo máximo de ejecución en segundos (default 30)
+
+        Yields:
+            OutputChunk en orden; el último con stream="exit"
+
+        Raises:
+            ConnectionError: Si la conexión falla o se pierde
+            TimeoutError: Si el comando supera el timeout
+        """
+
+    @abstractmethod
+    def session(self, sudo: bool = False) -> AbstractAsyncContextManager[ShellSession]:
+        """
+        Abre una sesión de shell para ejecutar varios comandos seguidos.
+
+        Evita arrancar un shell (y, con sudo, una autenticación sudo) por
+        comando: útil para pipelines con muchos pasos cortos. Si la sesión se
+        rompe, los comandos siguientes se ejecutan por la vía de execute().
+
+        Uso:
+            async with connection.session(sudo=True) as shell:
+                rc, stdout, stderr = await shell.execute("apt-get update")
+
+        Args:
+            sudo: Si True, la sesión entera corre elevada
+
+        Returns:
+            Context manager async que entrega una ShellSession
+        """
+
     @abstractmethod
     async def upload_file(self, local_path: str, remote_path: str) -> None:
         """
@@ -42,6 +94,28 @@ class Connection(ABC):
             FileNotFoundError: Si el archivo local no existe
         """
 
+    @abstractmethod
+    async def upload_many(
+        self, pairs: Sequence[tuple[str, str]], concurrency: int = 8
+    ) -> list[FileTransferResult]:
+        """
+        Transfiere varios archivos locales al servidor remoto en paralelo.
+
+        Crea todos los directorios destino en una sola llamada y mantiene hasta
+        `concurrency` transferencias en vuelo a la vez. Un archivo que falla no
+        interrumpe al resto: su resultado lleva success=False y el error.
+
+        Args:
+            pairs: Secuencia de tuplas (local_path, remote_path)
+            concurrency: Transferencias simultáneas máximas (default 8)
+
+        Returns:
+            Lista de FileTransferResult en el mismo orden que `pairs`
+
+        Raises:
+            ConnectionError: Si la conexión falla antes de poder transferir
+        """
+
     @abstractmethod
     async def file_exists(self, remote_path: str) -> bool:
         """
@@ -57,6 +131,43 @@ class Connection(ABC):
             ConnectionError: Si la comprobación falla
         """
 
+    @abstractmethod
+    async def stat_many(
+        self, paths: Sequence[str], sha256: bool = False, timeout: int = 60
+    ) -> list[RemoteFileStat]:
+        """
+        Consulta existencia, tamaño y mtime de varios paths en una sola invocación.
+
+        Sustituye N llamadas a file_exists() por un único round trip, p.ej. para
+        validar la caché de ficheros de un kit (ADR-013).
+
+        Args:
+            paths: Rutas a consultar en el servidor remoto
+            sha256: Si True, calcula además el SHA-256 de cada archivo regular
+            timeout: Timeout de la consulta en segundos (default 60)
+
+        Returns:
+            Lista de RemoteFileStat en el mismo orden que `paths`
+
+        Raises:
+            ConnectionError: Si la conexión falla
+        """
+
+    async def hash_many(
+        self, paths: Sequence[str], timeout: int = 60
+    ) -> list[RemoteFileStat]:
+        """
+        Igual que stat_many() pero incluyendo el SHA-256 de cada archivo.
+
+        Args:
+            paths: Rutas a consultar en el servidor remoto
+            timeout: Timeout de la consulta en segundos (default 60)
+
+        Returns:
+            Lista de RemoteFileStat con sha256 en el mismo orden que `paths`
+        """
+        return await self.stat_many(paths, sha256=True, timeout=timeout)
+
     @abstractmethod
     async def close(self) -> None:
         """
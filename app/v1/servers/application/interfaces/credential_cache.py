@@ -0,0 +1,25 @@
+"""
+Interface para la caché de credenciales descifradas.
+
+Define el contrato que será implementado en infrastructure/services/.
+"""
+from abc import ABC, abstractmethod
+
+
+class CredentialCache(ABC):
+    """Contrato mínimo que necesita la capa de aplicación para invalidar la caché."""
+
+    @abstractmethod
+    def invalidate(self, credential_id: str) -> None:
+        """
+        Descarta (y borra de memoria) la entrada de una credencial.
+
+        Es idempotente: si la credencial no está en caché no hace nada.
+
+        Args:
+            credential_id: ID de la credencial modificada o eliminada
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Descarta todas las entradas borrando sus secretos de memoria."""
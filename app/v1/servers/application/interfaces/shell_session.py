@@ -0,0 +1,27 @@
+"""
+Interface para una sesión de shell remota de larga duración.
+
+Define el contrato que será implementado por los adaptadores concretos
+en infrastructure/adapters/.
+"""
+from abc import ABC, abstractmethod
+
+
+class ShellSession(ABC):
+    """Ejecuta comandos secuencialmente dentro de una misma sesión remota."""
+
+    @abstractmethod
+    async def execute(self, command: str, timeout: int = 30) -> tuple[int, str, str]:
+        """
+        Ejecuta un comando dentro de la sesión, con el mismo contrato que Connection.execute().
+
+        Args:
+            command: Comando a ejecutar
+            timeout: Timeout de ejecución en segundos (default 30)
+
+        Returns:
+            Tupla (return_code, stdout, stderr)
+
+        Raises:
+            ConnectionError: Si la conexión falla o se supera el timeout
+        """
@@ -2,6 +2,7 @@
 import time
 
 from app.v1.servers.application.dtos.health_check_result import HealthCheckResult
+from app.v1.servers.application.exceptions import ServerCircuitOpenError
 from app.v1.servers.application.interfaces.connection_factory import ConnectionFactory
 from app.v1.servers.application.interfaces.server_repository import ServerRepository
 from app.v1.servers.domain.exceptions.server import ServerNotFoundError, ServerCredentialRequiredError
@@ -11,7 +12,8 @@ class CheckServerHealth:
     """Use Case para verificar la conectividad y SO de un servidor.
 
     Detecta el SO desde /etc/os-release y actualiza os_info en el servidor.
-    Devuelve offline sin lanzar excepción si la conexión falla.
+    Devuelve offline sin lanzar excepción si la conexión falla o si el circuit
+    breaker del servidor está abierto (sin esperar al timeout de conexión).
     """
 
     def __init__(
@@ -76,6 +78,17 @@ class CheckServerHealth:
                 os_name=os_name,
             )
 
+        except ServerCircuitOpenError as exc:
+            return HealthCheckResult(
+                server_id=server_id,
+                status="offline",
+                latency_ms=None,
+                os_id=None,
+                os_version=None,
+                os_name=None,
+                circuit_state=exc.state,
+            )
+
         except (ConnectionError, TimeoutError, OSError):
             return HealthCheckResult(
                 server_id=server_id,
@@ -53,6 +53,7 @@ class GetServer:
             os_id=server.os_id,
             os_version=server.os_version,
             os_name=server.os_name,
+            transport_profile=server.transport_profile.value,
             created_at=server.created_at,
             updated_at=server.updated_at,
         )
@@ -47,6 +47,7 @@ class ListServers:
                 os_id=s.os_id,
                 os_version=s.os_version,
                 os_name=s.os_name,
+                transport_profile=s.transport_profile.value,
                 created_at=s.created_at,
                 updated_at=s.updated_at,
             )
@@ -1,9 +1,10 @@
 """Entity Server."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from app.v1.servers.domain.value_objects.server_type import ServerType
 from app.v1.servers.domain.value_objects.server_status import ServerStatus
+from app.v1.servers.domain.value_objects.transport_profile import TransportProfile
 from app.v1.servers.domain.exceptions.server import InvalidServerConfigurationError
 
 
@@ -29,6 +30,8 @@ class Server:
     os_name: str | None
     created_at: datetime
     updated_at: datetime
+    # Solo aplica a remote: ajustes de cifrado, compresión y keepalive del SSH
+    transport_profile: TransportProfile = field(default_factory=TransportProfile)
 
     def __post_init__(self) -> None:
         """Valida la configuración del servidor según su tipo.
@@ -73,10 +76,12 @@ class Server:
         host: str | None = None,
         port: int | None = None,
         credential_id: str | None = None,
+        transport_profile: str | None = None,
     ) -> None:
         """Actualiza los campos mutables del servidor.
 
-        Para servidores remote: actualiza name, description, host, port y credential_id.
+        Para servidores remote: actualiza name, description, host, port, credential_id
+        y transport_profile.
         Para servidores local: solo actualiza name y description (host y credential_id se ignoran).
 
         Args:
@@ -86,6 +91,10 @@ class Server:
             host: Nuevo host (solo aplica a remote).
             port: Nuevo puerto (solo aplica a remote).
             credential_id: Nueva credencial (solo aplica a remote).
+            transport_profile: Nuevo perfil de transporte SSH (solo aplica a remote).
+
+        Raises:
+            InvalidTransportProfileError: Si el perfil no es uno de los permitidos.
         """
         self.name = name
         self.description = description
@@ -97,6 +106,8 @@ class Server:
                 self.port = port
             if credential_id is not None:
                 self.credential_id = credential_id
+            if transport_profile is not None:
+                self.transport_profile = TransportProfile(transport_profile)
 
     def update_os_info(self, os_id: str, os_version: str, os_name: str) -> None:
         """Actualiza la información del sistema operativo detectado.
@@ -24,3 +24,7 @@ class InvalidServerConfigurationError(DomainException):
 
 class ServerCredentialRequiredError(DomainException):
     """El servidor no tiene credencial asignada y la operación la requiere."""
+
+
+class InvalidTransportProfileError(DomainException):
+    """Perfil de transporte SSH inválido. Solo se permiten: default, lan, wan."""
@@ -0,0 +1,17 @@
+"""Value Object TransportProfile."""
+from dataclasses import dataclass
+
+from app.v1.servers.domain.exceptions.server import InvalidTransportProfileError
+
+VALID_PROFILES = {"default", "lan", "wan"}
+
+
+@dataclass(frozen=True)
+class TransportProfile:
+    """Perfil de transporte SSH del servidor. Valores permitidos: default, lan, wan."""
+
+    value: str = "default"
+
+    def __post_init__(self) -> None:
+        if self.value not in VALID_PROFILES:
+            raise InvalidTransportProfileError()
@@ -2,29 +2,74 @@
 
 Para servidores `remote`: crea un SSHConnectionAdapter resolviendo la credencial
 del CredentialRepository. La credencial se descifra en memoria y nunca se persiste
-en claro.
+en claro. El adaptador toma prestadas las conexiones del SSHConnectionPool
+compartido, usando como clave el servidor y la versión de la credencial.
+Con un InMemoryCredentialCache, la credencial descifrada y su clave SSH ya
+parseada se reutilizan entre llamadas hasta que caducan o se invalidan.
+
+El perfil de transporte del servidor (TransportProfile) se traduce a un
+SSHTransportProfile con los cifrados, compresión, keepalive y ventana a negociar.
+
+Con un CircuitBreaker, un servidor con el breaker abierto se rechaza con
+ServerCircuitOpenError antes de resolver la credencial o intentar conectar.
 
 Para servidores `local`: devuelve un LocalConnectionAdapter sin consultar credenciales.
 """
+from app.v1.servers.application.interfaces.circuit_breaker import CircuitBreaker
 from app.v1.servers.application.interfaces.connection import Connection
 from app.v1.servers.application.interfaces.connection_factory import ConnectionFactory as ConnectionFactoryPort
 from app.v1.servers.application.interfaces.credential_repository import CredentialRepository
 from app.v1.servers.domain.entities.server import Server
 from app.v1.servers.infrastructure.adapters.local_connection import LocalConnectionAdapter
 from app.v1.servers.infrastructure.adapters.ssh_connection import SSHConnectionAdapter
+from app.v1.servers.infrastructure.adapters.ssh_connect_governor import SSHConnectGovernor
+from app.v1.servers.infrastructure.adapters.ssh_connection_pool import SSHConnectionPool
+from app.v1.servers.infrastructure.adapters.ssh_transport import get_transport_profile
+from app.v1.servers.infrastructure.services.credential_cache import (
+    CachedCredential,
+    InMemoryCredentialCache,
+)
 
 
 class ConnectionFactory(ConnectionFactoryPort):
     """Factory que construye el adaptador de conexión adecuado para un servidor."""
 
-    def __init__(self, credential_repository: CredentialRepository) -> None:
+    def __init__(
+        self,
+        credential_repository: CredentialRepository,
+        connection_pool: SSHConnectionPool | None = None,
+        credential_cache: InMemoryCredentialCache | None = None,
+        connect_governor: SSHConnectGovernor | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Inicializa la factory.
+
+        Args:
+            credential_repository: Repositorio para resolver la credencial del servidor.
+            connection_pool: Pool SSH compartido del proceso (singleton de main.py).
+                Si es None, cada adaptador usa un pool privado.
+            credential_cache: Caché de credenciales descifradas (singleton de main.py).
+                Si es None, cada llamada consulta el repositorio.
+            connect_governor: Limitador de handshakes SSH (singleton de main.py).
+                Si es None, los connect no se limitan.
+            circuit_breaker: Circuit breaker por servidor compartido en Valkey.
+                Si es None, no se corta nunca el acceso a un servidor.
+        """
         self._credential_repo = credential_repository
+        self._pool = connection_pool
+        self._credential_cache = credential_cache
+        self._governor = connect_governor
+        self._breaker = circuit_breaker
 
-    async def create(self, server: Server) -> Connection:
+    async def create(
+        self, server: Server, transport_profile: str | None = None
+    ) -> Connection:
         """Crea y devuelve el adaptador de conexión para el servidor dado.
 
         Args:
             server: Entidad Server para la que se crea la conexión.
+            transport_profile: Perfil de transporte a usar en lugar del guardado
+                en el servidor (lo usa el benchmark de perfiles).
 
         Returns:
             SSHConnectionAdapter para servidores remote.
@@ -32,25 +77,53 @@ class ConnectionFactory(ConnectionFactoryPort):
 
         Raises:
             ValueError: Si el servidor remote referencia una credencial inexistente.
+            ServerCircuitOpenError: Si el circuit breaker del servidor está abierto.
         """
         if server.type.value == "local":
             return LocalConnectionAdapter()
 
+        if self._breaker is not None:
+            await self._breaker.before_call(server.id)
+
         # Servidor remote — resolver credencial
         # server.credential_id está garantizado por Server.__post_init__ para type=remote
         credential_id: str = server.credential_id  # type: ignore[assignment]
-        credential = await self._credential_repo.find_by_id(
-            credential_id, server.user_id
-        )
+        credential = await self._resolve_credential(credential_id, server.user_id)
         if credential is None:
             raise ValueError(
                 f"Credencial '{server.credential_id}' no encontrada para el servidor '{server.id}'"
             )
 
+        host: str = server.host  # type: ignore[assignment]
+        port = server.port or 22
+        profile = get_transport_profile(transport_profile or server.transport_profile.value)
+
         return SSHConnectionAdapter(
-            host=server.host,  # type: ignore[arg-type]
-            port=server.port or 22,
+            host=host,
+            port=port,
             username=credential.username,  # type: ignore[arg-type]
-            private_key=credential.private_key,
+            private_key=credential.private_key if credential.client_key is None else None,
             password=credential.password,
+            client_key=credential.client_key,
+            connect_governor=self._governor,
+            user_id=server.user_id,
+            circuit_breaker=self._breaker,
+            server_id=server.id,
+            transport_profile=profile,
+            pool=self._pool,
+            pool_key=SSHConnectionPool.make_key(
+                server.id, host, port, credential.version, profile.name
+            ),
+        )
+
+    async def _resolve_credential(
+        self, credential_id: str, user_id: str
+    ) -> CachedCredential | None:
+        """Obtiene la credencial de la caché o, si no hay caché, del repositorio."""
+        loader = lambda: self._credential_repo.find_by_id(credential_id, user_id)  # noqa: E731
+        if self._credential_cache is not None:
+            return await self._credential_cache.get_or_load(credential_id, user_id, loader)
+        # Sin caché compartida: una instancia de un solo uso con la misma lógica
+        return await InMemoryCredentialCache(ttl_seconds=0).get_or_load(
+            credential_id, user_id, loader
         )
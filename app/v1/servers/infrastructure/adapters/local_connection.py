@@ -8,11 +8,20 @@ permisos del usuario que levantó ikctl (RNF-16).
 La transferencia de archivos se resuelve con shutil.copy2 (copia local a local).
 """
 import asyncio
+import hashlib
 import logging
 import os
 import shutil
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager, suppress
 
+from app.v1.servers.application.dtos.file_transfer_result import FileTransferResult
+from app.v1.servers.application.dtos.output_chunk import OutputChunk
+from app.v1.servers.application.dtos.remote_file_stat import RemoteFileStat
 from app.v1.servers.application.interfaces.connection import Connection
+from app.v1.servers.application.interfaces.shell_session import ShellSession
+from app.v1.servers.infrastructure.adapters.output_stream import iter_output
+from app.v1.servers.infrastructure.adapters.shell_session import ExecShellSession
 from app.v1.servers.infrastructure.exceptions import SSHConnectionError
 
 logger = logging.getLogger(__name__)
@@ -60,6 +69,75 @@ class LocalConnectionAdapter(Connection):
                 f"Error ejecutando comando local: {exc}"
             ) from exc
 
+    async def stream(
+        self, command: str, sudo: bool = False, timeout: int = 30
+    ) -> AsyncIterator[OutputChunk]:
+        """Ejecuta un comando local y emite stdout/stderr a medida que se producen.
+
+        Args:
+            command: Comando a ejecutar.
+            sudo: Ignorado — se emite un WARNING (RNF-16).
+            timeout: Timeout de ejecución en segundos (default 30).
+
+        Yields:
+            OutputChunk en orden de llegada; el último con stream="exit".
+
+        Raises:
+            SSHConnectionError: Si el subprocess falla o se supera el timeout.
+        """
+        if sudo:
+            logger.warning(
+                "sudo=True ignorado en LocalConnectionAdapter — "
+                "el proceso local ya corre con los permisos de ikctl (RNF-16)"
+            )
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        proc = None
+        try:
+            proc = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            seq = 0
+            async for name, data in iter_output(
+                proc.stdout, proc.stderr, timeout=timeout, decode=True
+            ):
+                yield OutputChunk(seq=seq, stream=name, data=data)
+                seq += 1
+            await asyncio.wait_for(proc.wait(), timeout=max(deadline - loop.time(), 0))
+            rc = proc.returncode if proc.returncode is not None else -1
+            yield OutputChunk(seq=seq, stream="exit", data="", exit_code=rc)
+        except asyncio.TimeoutError as exc:
+            raise SSHConnectionError(
+                f"Timeout ({timeout}s) ejecutando comando local"
+            ) from exc
+        except Exception as exc:
+            raise SSHConnectionError(
+                f"Error ejecutando comando local: {exc}"
+            ) from exc
+        finally:
+            if proc is not None and proc.returncode is None:
+                with suppress(ProcessLookupError):
+                    proc.kill()
+                await proc.wait()
+
+    @asynccontextmanager
+    async def session(self, sudo: bool = False) -> AsyncIterator[ShellSession]:
+        """Sesión local: cada comando es un execute() independiente.
+
+        Arrancar un proceso local no tiene el coste de login/sudo que justifica
+        un shell persistente en remoto.
+
+        Args:
+            sudo: Ignorado — se emite un WARNING en cada comando (RNF-16).
+
+        Yields:
+            ShellSession que delega en execute().
+        """
+        yield ExecShellSession(self, sudo=sudo)
+
     async def upload_file(self, local_path: str, remote_path: str) -> None:
         """Copia un archivo de local_path a remote_path en el sistema de archivos local.
 
@@ -77,6 +155,46 @@ class LocalConnectionAdapter(Connection):
                 f"Error copiando archivo local {local_path} → {remote_path}: {exc}"
             ) from exc
 
+    async def upload_many(
+        self, pairs: Sequence[tuple[str, str]], concurrency: int = 8
+    ) -> list[FileTransferResult]:
+        """Copia varios archivos en paralelo en el sistema de archivos local.
+
+        Cada copia corre en un hilo (asyncio.to_thread) para no bloquear el
+        event loop; como mucho `concurrency` copias a la vez.
+
+        Args:
+            pairs: Secuencia de tuplas (local_path, remote_path).
+            concurrency: Copias simultáneas máximas (default 8).
+
+        Returns:
+            Lista de FileTransferResult en el mismo orden que `pairs`.
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        def _copy(local_path: str, remote_path: str) -> int:
+            parent = os.path.dirname(remote_path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            shutil.copy2(local_path, remote_path)
+            return os.path.getsize(remote_path)
+
+        async def _copy_one(local_path: str, remote_path: str) -> FileTransferResult:
+            async with semaphore:
+                try:
+                    size = await asyncio.to_thread(_copy, local_path, remote_path)
+                except Exception as exc:
+                    return FileTransferResult(
+                        local_path, remote_path, success=False, error=str(exc)
+                    )
+            return FileTransferResult(
+                local_path, remote_path, success=True, bytes_transferred=size
+            )
+
+        return list(await asyncio.gather(*(
+            _copy_one(local_path, remote_path) for local_path, remote_path in pairs
+        )))
+
     async def file_exists(self, remote_path: str) -> bool:
         """Comprueba si un path existe en el sistema de archivos local.
 
@@ -88,5 +206,49 @@ class LocalConnectionAdapter(Connection):
         """
         return os.path.exists(remote_path)
 
+    async def stat_many(
+        self, paths: Sequence[str], sha256: bool = False, timeout: int = 60
+    ) -> list[RemoteFileStat]:
+        """Consulta varios paths del sistema de archivos local en un hilo.
+
+        Args:
+            paths: Rutas a consultar.
+            sha256: Si True, calcula además el SHA-256 de cada archivo regular.
+            timeout: Timeout de la consulta en segundos (default 60).
+
+        Returns:
+            Lista de RemoteFileStat en el mismo orden que `paths`.
+
+        Raises:
+            SSHConnectionError: Si se supera el timeout.
+        """
+
+        def _stat(path: str) -> RemoteFileStat:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return RemoteFileStat(path=path, exists=False)
+            except OSError:
+                return RemoteFileStat(path=path, exists=os.path.exists(path))
+            digest = None
+            if sha256 and os.path.isfile(path):
+                try:
+                    with open(path, "rb") as fh:
+                        digest = hashlib.file_digest(fh, "sha256").hexdigest()
+                except OSError:
+                    digest = None
+            return RemoteFileStat(
+                path=path, exists=True, size=st.st_size, mtime=st.st_mtime, sha256=digest
+            )
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.to_thread(lambda: [_stat(path) for path in paths]), timeout=timeout
+            )
+        except asyncio.TimeoutError as exc:
+            raise SSHConnectionError(
+                f"Timeout ({timeout}s) consultando archivos locales"
+            ) from exc
+
     async def close(self) -> None:
         """No-op — no hay conexión que cerrar en el adaptador local."""
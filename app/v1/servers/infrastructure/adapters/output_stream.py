@@ -0,0 +1,82 @@
+"""Lectura concurrente de stdout/stderr con backpressure para Connection.stream().
+
+Compartido por SSHConnectionAdapter y LocalConnectionAdapter. Dos tareas leen
+los pipes y depositan fragmentos en una cola acotada: si el consumidor va lento,
+la cola se llena, los lectores dejan de leer y el proceso (o la ventana SSH)
+se bloquea en lugar de acumular la salida en memoria.
+"""
+import asyncio
+import codecs
+from collections.abc import AsyncIterator
+from typing import Any
+
+CHUNK_SIZE = 64 * 1024
+MAX_BUFFERED_CHUNKS = 16
+
+
+async def iter_output(
+    stdout: Any,
+    stderr: Any,
+    timeout: float | None = None,
+    decode: bool = False,
+) -> AsyncIterator[tuple[str, str]]:
+    """Itera los fragmentos de stdout y stderr en orden de llegada.
+
+    Args:
+        stdout: Reader con `await read(n)` que devuelve "" o b"" al llegar a EOF.
+        stderr: Reader equivalente para stderr.
+        timeout: Segundos máximos hasta agotar ambos readers (None = sin límite).
+        decode: Si True, los readers devuelven bytes y se decodifican como UTF-8
+            sin partir caracteres multibyte entre fragmentos.
+
+    Yields:
+        Tuplas (nombre_stream, datos) con nombre "stdout" o "stderr".
+
+    Raises:
+        asyncio.TimeoutError: Si se supera el timeout.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_BUFFERED_CHUNKS)
+
+    async def _pump(name: str, reader: Any) -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace") if decode else None
+        try:
+            while True:
+                data = await reader.read(CHUNK_SIZE)
+                if not data:
+                    break
+                if decoder is not None:
+                    data = decoder.decode(data)
+                if data:
+                    await queue.put((name, data))
+            if decoder is not None:
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    await queue.put((name, tail))
+        except Exception as exc:
+            await queue.put((name, exc))
+            return
+        await queue.put((name, None))
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout is not None else None
+    tasks = [
+        asyncio.create_task(_pump("stdout", stdout)),
+        asyncio.create_task(_pump("stderr", stderr)),
+    ]
+    open_streams = len(tasks)
+    try:
+        while open_streams:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                raise asyncio.TimeoutError
+            name, data = await asyncio.wait_for(queue.get(), timeout=remaining)
+            if data is None:
+                open_streams -= 1
+            elif isinstance(data, Exception):
+                raise data
+            else:
+                yield name, data
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
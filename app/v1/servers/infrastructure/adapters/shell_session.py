@@ -0,0 +1,166 @@
+"""Implementaciones de ShellSession para Connection.session().
+
+- ExecShellSession: delega cada comando en Connection.execute(). Es la sesión
+  del adaptador local y el fallback cuando la sesión persistente se rompe.
+- SentinelShellSession: mantiene un único `sh` remoto (opcionalmente ya
+  elevado con sudo) y le escribe los comandos por stdin. Cada comando corre en
+  un `sh -c` hijo con stdin en /dev/null — un error de sintaxis o un `exit` no
+  matan la sesión — seguido de marcas únicas en stdout (con el exit code) y en
+  stderr que delimitan su salida.
+
+Si la sesión no puede abrirse o se rompe antes de entregar un comando, ese
+comando y los siguientes se ejecutan por la vía de exec. Si se rompe con un
+comando en curso no se reintenta: podría haberse ejecutado ya.
+"""
+import asyncio
+import re
+import shlex
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, AsyncExitStack
+from typing import Any
+from uuid import uuid4
+
+from app.v1.servers.application.interfaces.connection import Connection
+from app.v1.servers.application.interfaces.shell_session import ShellSession
+from app.v1.servers.infrastructure.adapters.output_stream import CHUNK_SIZE
+from app.v1.servers.infrastructure.exceptions import SSHConnectionError
+from app.v1.shared.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _SessionBroken(Exception):
+    """El shell de la sesión terminó antes de emitir la marca del comando."""
+
+
+class ExecShellSession(ShellSession):
+    """Sesión sin estado: cada comando es un Connection.execute() independiente."""
+
+    def __init__(self, connection: Connection, sudo: bool = False) -> None:
+        self._connection = connection
+        self._sudo = sudo
+
+    async def execute(self, command: str, timeout: int = 30) -> tuple[int, str, str]:
+        return await self._connection.execute(command, sudo=self._sudo, timeout=timeout)
+
+
+class SentinelShellSession(ShellSession):
+    """Sesión sobre un shell persistente delimitando cada comando con marcas."""
+
+    def __init__(
+        self,
+        open_shell: Callable[[], AbstractAsyncContextManager[Any]],
+        fallback: ShellSession,
+    ) -> None:
+        """Inicializa la sesión; el shell se abre en el primer comando.
+
+        Args:
+            open_shell: Context manager async que entrega un proceso con stdin,
+                stdout y stderr en modo texto (p.ej. asyncssh SSHClientProcess).
+            fallback: Sesión a usar si el shell no puede abrirse o se rompe.
+        """
+        self._open_shell = open_shell
+        self._fallback = fallback
+        self._stack: AsyncExitStack | None = None
+        self._process: Any = None
+        self._broken = False
+        self._token = uuid4().hex
+        self._seq = 0
+        self._lock = asyncio.Lock()
+
+    async def execute(self, command: str, timeout: int = 30) -> tuple[int, str, str]:
+        """Ejecuta el comando en el shell de la sesión (o por exec si está rota).
+
+        Raises:
+            SSHConnectionError: Si se supera el timeout o la sesión se rompe con
+                el comando en curso.
+        """
+        async with self._lock:
+            if self._broken:
+                return await self._fallback.execute(command, timeout=timeout)
+
+            marker = f"__IKCTL_{self._token}_{self._seq}__"
+            self._seq += 1
+            script = (
+                f"sh -c {shlex.quote(command)} < /dev/null\n"
+                f"printf '\\n{marker} %d\\n' $?\n"
+                f"printf '\\n{marker}\\n' >&2\n"
+            )
+            try:
+                process = await self._ensure_shell()
+                process.stdin.write(script)
+            except Exception as exc:
+                # El comando no llegó a entregarse: es seguro ejecutarlo por exec
+                await self._mark_broken(exc)
+                return await self._fallback.execute(command, timeout=timeout)
+
+            try:
+                (stdout, rc), (stderr, _) = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._read_until(
+                            process.stdout, re.compile(rf"\n{marker} (-?\d+)\n")
+                        ),
+                        self._read_until(process.stderr, re.compile(rf"\n{marker}\n")),
+                    ),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError as exc:
+                # El comando sigue corriendo: se descarta el shell y el siguiente abre otro
+                await self._discard()
+                raise SSHConnectionError(
+                    f"Timeout ({timeout}s) ejecutando comando en la sesión"
+                ) from exc
+            except Exception as exc:
+                await self._mark_broken(exc)
+                raise SSHConnectionError(
+                    f"La sesión remota se cerró durante el comando: {exc}"
+                ) from exc
+            return rc, stdout, stderr
+
+    async def close(self) -> None:
+        """Cierra el shell de la sesión y devuelve su canal."""
+        async with self._lock:
+            await self._discard()
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    async def _ensure_shell(self) -> Any:
+        if self._process is None:
+            stack = AsyncExitStack()
+            try:
+                self._process = await stack.enter_async_context(self._open_shell())
+            except BaseException:
+                await stack.aclose()
+                raise
+            self._stack = stack
+        return self._process
+
+    @staticmethod
+    async def _read_until(reader: Any, pattern: re.Pattern) -> tuple[str, int | None]:
+        """Lee hasta la marca; devuelve la salida previa y el exit code si la marca lo lleva."""
+        buffer = ""
+        while True:
+            match = pattern.search(buffer)
+            if match is not None:
+                rc = int(match.group(1)) if match.groups() else None
+                # El "\n" que precede a la marca lo añade el script, no el comando
+                return buffer[: match.start()], rc
+            data = await reader.read(CHUNK_SIZE)
+            if not data:
+                raise _SessionBroken("EOF antes de la marca de fin de comando")
+            buffer += data
+
+    async def _discard(self) -> None:
+        stack, self._stack, self._process = self._stack, None, None
+        if stack is not None:
+            try:
+                await stack.aclose()
+            except Exception as exc:
+                logger.debug("shell_session_close_failed", error=str(exc))
+
+    async def _mark_broken(self, exc: BaseException) -> None:
+        logger.warning("shell_session_broken", error=str(exc))
+        self._broken = True
+        await self._discard()
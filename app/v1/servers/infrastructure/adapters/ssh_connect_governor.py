@@ -0,0 +1,198 @@
+"""SSHConnectGovernor — Limita los handshakes SSH en vuelo de todo el proceso.
+
+Un health check de grupo o un pipeline puede lanzar cientos de asyncssh.connect()
+a la vez: el intercambio de claves satura la CPU y los bastiones compartidos
+cortan conexiones al superar MaxStartups de sshd. El governor reparte permisos
+para conectar con:
+
+- Un límite global que arranca en `ramp_start` y crece de uno en uno con cada
+  handshake correcto hasta `max_concurrent`; un fallo de red lo reduce a la mitad.
+- Un límite por host (host:port).
+- Una cola justa por usuario: los permisos se ceden en round-robin entre
+  usuarios, así que un job de 500 servidores no deja sin turno al health check
+  de otro usuario.
+
+Solo regula el connect; los canales sobre conexiones ya abiertas los gestiona
+el SSHConnectionPool.
+"""
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import asyncssh
+
+from app.v1.shared.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Fallos de red en el connect (timeouts, resets, MaxStartups): frenan la rampa
+CONNECT_NETWORK_ERRORS = (OSError, asyncio.TimeoutError, asyncssh.ConnectionLost)
+
+
+@dataclass(eq=False)
+class _Waiter:
+    host: str
+    future: asyncio.Future
+    enqueued_at: float = field(default=0.0)
+
+
+class SSHConnectGovernor:
+    """Semáforo global + por host con rampa gradual y cola justa por usuario."""
+
+    def __init__(
+        self,
+        max_concurrent: int = 32,
+        max_per_host: int = 4,
+        ramp_start: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Inicializa el governor.
+
+        Args:
+            max_concurrent: Handshakes simultáneos máximos en todo el proceso.
+            max_per_host: Handshakes simultáneos máximos contra un mismo host:port.
+            ramp_start: Límite global inicial (y mínimo tras fallos).
+            clock: Reloj monotónico (inyectable para tests).
+        """
+        self._max_concurrent = max_concurrent
+        self._max_per_host = max_per_host
+        self._ramp_start = max(1, min(ramp_start, max_concurrent))
+        self._limit = self._ramp_start
+        self._clock = clock
+        self._in_flight = 0
+        self._per_host: dict[str, int] = {}
+        # Un deque por usuario; el orden del OrderedDict es el turno round-robin
+        self._queues: OrderedDict[str, deque[_Waiter]] = OrderedDict()
+        self._waits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @asynccontextmanager
+    async def slot(self, host: str, user_id: str | None = None) -> AsyncIterator[None]:
+        """Reserva un permiso para conectar a `host` mientras dura el bloque.
+
+        Args:
+            host: Destino del connect ("host:port").
+            user_id: Usuario que origina el connect (turno de la cola justa).
+        """
+        await self._acquire(host, user_id or "")
+        outcome: bool | None = True
+        try:
+            yield
+        except CONNECT_NETWORK_ERRORS:
+            outcome = False
+            raise
+        except BaseException:
+            # Credenciales inválidas, cancelación...: no dicen nada de la carga
+            outcome = None
+            raise
+        finally:
+            self._release(host, outcome)
+
+    def stats(self) -> dict:
+        """Instantánea de métricas: permisos en vuelo, límite actual, cola y esperas."""
+        return {
+            "in_flight": self._in_flight,
+            "limit": self._limit,
+            "max_concurrent": self._max_concurrent,
+            "queued": sum(len(queue) for queue in self._queues.values()),
+            "queued_by_user": {user: len(queue) for user, queue in self._queues.items()},
+            "waits": self._waits,
+            "wait_seconds_avg": self._wait_total / self._waits if self._waits else 0.0,
+            "wait_seconds_max": self._wait_max,
+        }
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    async def _acquire(self, host: str, user_id: str) -> None:
+        waiter = _Waiter(
+            host=host,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=self._clock(),
+        )
+        self._queues.setdefault(user_id, deque()).append(waiter)
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # El permiso llegó a la vez que la cancelación: se devuelve
+                self._release(host, None)
+            else:
+                self._discard(user_id, waiter)
+            raise
+
+        waited = self._clock() - waiter.enqueued_at
+        self._waits += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        if waited > 0:
+            logger.debug(
+                "ssh_connect_queued",
+                host=host,
+                user_id=user_id,
+                wait_seconds=round(waited, 3),
+                queued=self.stats()["queued"],
+            )
+
+    def _dispatch(self) -> None:
+        """Cede permisos libres en round-robin entre usuarios respetando el límite por host."""
+        while self._in_flight < self._limit:
+            granted = False
+            for user_id in list(self._queues):
+                queue = self._queues[user_id]
+                waiter = next(
+                    (
+                        w for w in queue
+                        if not w.future.done()
+                        and self._per_host.get(w.host, 0) < self._max_per_host
+                    ),
+                    None,
+                )
+                if waiter is None:
+                    continue
+                queue.remove(waiter)
+                if queue:
+                    # Al final del turno: el siguiente usuario va primero
+                    self._queues.move_to_end(user_id)
+                else:
+                    del self._queues[user_id]
+                self._in_flight += 1
+                self._per_host[waiter.host] = self._per_host.get(waiter.host, 0) + 1
+                waiter.future.set_result(None)
+                granted = True
+                break
+            if not granted:
+                return
+
+    def _release(self, host: str, outcome: bool | None) -> None:
+        self._in_flight -= 1
+        remaining = self._per_host.get(host, 0) - 1
+        if remaining > 0:
+            self._per_host[host] = remaining
+        else:
+            self._per_host.pop(host, None)
+
+        if outcome is True:
+            self._limit = min(self._limit + 1, self._max_concurrent)
+        elif outcome is False:
+            self._limit = max(self._ramp_start, self._limit // 2)
+            logger.warning("ssh_connect_backoff", host=host, limit=self._limit)
+        self._dispatch()
+
+    def _discard(self, user_id: str, waiter: _Waiter) -> None:
+        queue = self._queues.get(user_id)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            return
+        if not queue:
+            del self._queues[user_id]
@@ -1,25 +1,93 @@
 """SSHConnectionAdapter — Implementación asyncssh del port Connection.
 
-Mantiene una única conexión SSH por instancia (connection pooling simple).
-La conexión se abre lazy en el primer uso y se reutiliza en las llamadas
-sucesivas. Llamar a close() cuando ya no se necesite la conexión.
+No posee conexiones propias: cada operación reserva un canal de una conexión
+del SSHConnectionPool compartido (ADR-003) y lo devuelve al terminar, así que
+varias operaciones concurrentes al mismo host se multiplexan sobre la misma
+conexión. Si no se inyecta un pool, el adaptador crea uno privado que se drena
+en close().
+
+Las opciones de transporte (cifrados, compresión, keepalive, ventana) salen
+del SSHTransportProfile del servidor. Con compresión "auto" las transferencias
+grandes viajan por una segunda conexión del pool negociada con zlib.
 
 Timeouts configurables por operación (RNF-03):
 - Conexión: connect_timeout (default 30s)
 - Ejecución de comando: timeout por llamada a execute() (default 30s)
 """
+import asyncio
+import functools
+import os
+import posixpath
+import shlex
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from typing import TypeVar
+
 import asyncssh
 
+from app.v1.servers.application.dtos.file_transfer_result import FileTransferResult
+from app.v1.servers.application.dtos.output_chunk import OutputChunk
+from app.v1.servers.application.dtos.remote_file_stat import RemoteFileStat
 from app.v1.servers.application.interfaces.connection import Connection
+from app.v1.servers.application.interfaces.shell_session import ShellSession
+from app.v1.servers.infrastructure.adapters.output_stream import CHUNK_SIZE, iter_output
+from app.v1.servers.infrastructure.adapters.shell_session import (
+    ExecShellSession,
+    SentinelShellSession,
+)
+from app.v1.servers.application.interfaces.circuit_breaker import CircuitBreaker
+from app.v1.servers.infrastructure.adapters.ssh_connect_governor import (
+    CONNECT_NETWORK_ERRORS,
+    SSHConnectGovernor,
+)
+from app.v1.servers.infrastructure.adapters.ssh_connection_pool import (
+    SFTP_SESSION_ERRORS,
+    SSHConnectionPool,
+)
+from app.v1.servers.infrastructure.adapters.ssh_transport import (
+    DEFAULT_PROFILE,
+    SSHTransportProfile,
+)
+from app.v1.servers.infrastructure.adapters.tar_stream import iter_tar_gz
 from app.v1.servers.infrastructure.exceptions import SSHConnectionError
 
+T = TypeVar("T")
+
+# Script POSIX de stat_many: una línea por argumento, en el mismo orden.
+# "E <size> <mtime> <sha256|->" si existe, "M" si no. SHA256 lo fija el llamador.
+_STAT_SCRIPT = (
+    'for p in "$@"; do '
+    'if [ -e "$p" ]; then '
+    "s=$(stat -L -c '%s %Y' -- \"$p\" 2>/dev/null) || s='- -'; "
+    "h=-; "
+    'if [ "$SHA256" = 1 ] && [ -f "$p" ]; then '
+    "h=$(sha256sum < \"$p\" 2>/dev/null | cut -d' ' -f1); [ -n \"$h\" ] || h=-; "
+    "fi; "
+    'printf \'E %s %s\\n\' "$s" "$h"; '
+    "else printf 'M\\n'; fi; "
+    "done"
+)
+
 
 class SSHConnectionAdapter(Connection):
     """Adaptador SSH basado en asyncssh.
 
-    Reutiliza la conexión abierta (connection pool de 1 conexión por instancia).
+    Reserva un canal de una conexión del SSHConnectionPool en cada operación.
     """
 
+    # Reintentos cuando el servidor rechaza abrir un canal (MaxSessions alcanzado)
+    _CHANNEL_OPEN_RETRIES = 3
+
+    # upload_many cambia a modo tar con muchos archivos pequeños: a partir de
+    # este número de archivos y mientras el total no supere el límite
+    TAR_MIN_FILES = 32
+    TAR_MAX_TOTAL_BYTES = 256 * 1024 * 1024
+
+    # Linux limita cada argumento de exec a 128 KiB (MAX_ARG_STRLEN) y sshd pasa
+    # el comando completo como un único argumento al shell
+    _STAT_MAX_COMMAND_BYTES = 96 * 1024
+
     def __init__(
         self,
         host: str,
@@ -28,6 +96,14 @@ class SSHConnectionAdapter(Connection):
         private_key: str | None = None,
         password: str | None = None,
         connect_timeout: int = 30,
+        pool: SSHConnectionPool | None = None,
+        pool_key: str | None = None,
+        client_key: asyncssh.SSHKey | None = None,
+        connect_governor: SSHConnectGovernor | None = None,
+        user_id: str | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        server_id: str | None = None,
+        transport_profile: SSHTransportProfile | None = None,
     ) -> None:
         """Inicializa el adaptador SSH.
 
@@ -38,24 +114,54 @@ class SSHConnectionAdapter(Connection):
             private_key: Clave privada SSH en formato PEM (opcional).
             password: Contraseña o PAT (opcional, alternativa a private_key).
             connect_timeout: Timeout de conexión en segundos (default 30).
+            pool: Pool compartido del proceso. Si es None se usa un pool privado.
+            pool_key: Clave del servidor en el pool (ver SSHConnectionPool.make_key).
+            client_key: Clave privada ya importada (p.ej. desde InMemoryCredentialCache).
+                Si se indica, tiene prioridad sobre private_key y evita parsear el PEM.
+            connect_governor: Limitador de handshakes del proceso (opcional).
+            user_id: Usuario que origina las operaciones (turno en la cola del governor).
+            circuit_breaker: Breaker por servidor al que se reportan los connect (opcional).
+            server_id: ID del servidor en el breaker (requerido si hay circuit_breaker).
+            transport_profile: Opciones de transporte SSH (default: las de asyncssh).
         """
         self._host = host
         self._port = port
         self._username = username
         self._private_key = private_key
         self._password = password
+        self._client_key = client_key
+        self._governor = connect_governor
+        self._user_id = user_id
+        self._breaker = circuit_breaker if server_id is not None else None
+        self._server_id = server_id
         self._connect_timeout = connect_timeout
-        self._conn: asyncssh.SSHClientConnection | None = None
+        self._owns_pool = pool is None
+        self._pool = pool if pool is not None else SSHConnectionPool()
+        self._pool_key = pool_key or f"{username}@{host}:{port}"
+        self._transport = transport_profile or DEFAULT_PROFILE
+        # Conexión aparte negociada con zlib para las transferencias grandes
+        self._bulk_pool_key = SSHConnectionPool.lane_key(self._pool_key, "zlib")
+        self._connect_compressed = functools.partial(self._connect, compressed=True)
 
-    async def _get_connection(self) -> asyncssh.SSHClientConnection:
-        """Devuelve la conexión activa, abriéndola si no existe todavía.
+    def _lane(
+        self, bulk: bool
+    ) -> tuple[str, Callable[[], Awaitable[asyncssh.SSHClientConnection]]]:
+        """Clave del pool y connector: la conexión comprimida solo si `bulk`."""
+        if bulk:
+            return self._bulk_pool_key, self._connect_compressed
+        return self._pool_key, self._connect
+
+    async def _connect(self, compressed: bool = False) -> asyncssh.SSHClientConnection:
+        """Abre una conexión SSH nueva. El pool la invoca cuando no hay ninguna libre.
+
+        Los fallos de red y los connect correctos se reportan al circuit breaker.
+
+        Args:
+            compressed: Variante comprimida del perfil de transporte (modo "auto").
 
         Raises:
             SSHConnectionError: Si no se puede establecer la conexión.
         """
-        if self._conn is not None:
-            return self._conn
-
         try:
             connect_kwargs: dict = {
                 "host": self._host,
@@ -64,21 +170,75 @@ class SSHConnectionAdapter(Connection):
                 "connect_timeout": self._connect_timeout,
                 # No verificar host keys en v1 (ver ADR-003)
                 "known_hosts": None,
+                **self._transport.connect_options(compressed),
             }
 
-            if self._private_key is not None:
-                connect_kwargs["client_keys"] = [self._private_key]
+            if self._client_key is not None:
+                connect_kwargs["client_keys"] = [self._client_key]
+            elif self._private_key is not None:
+                # Un str en client_keys se interpretaría como ruta a fichero
+                connect_kwargs["client_keys"] = [
+                    asyncssh.import_private_key(self._private_key)
+                ]
             if self._password is not None:
                 connect_kwargs["password"] = self._password
 
-            self._conn = await asyncssh.connect(**connect_kwargs)
-            return self._conn
+            if self._governor is None:
+                conn = await asyncssh.connect(**connect_kwargs)
+            else:
+                async with self._governor.slot(f"{self._host}:{self._port}", self._user_id):
+                    conn = await asyncssh.connect(**connect_kwargs)
 
         except Exception as exc:
+            if self._breaker is not None and isinstance(exc, CONNECT_NETWORK_ERRORS):
+                await self._breaker.record_failure(self._server_id)  # type: ignore[arg-type]
             raise SSHConnectionError(
                 f"No se pudo conectar a {self._host}:{self._port} — {exc}"
             ) from exc
 
+        if self._breaker is not None:
+            await self._breaker.record_success(self._server_id)  # type: ignore[arg-type]
+        return conn
+
+    async def _with_channel(
+        self,
+        operation: Callable[[asyncssh.SSHClientConnection], Awaitable[T]],
+        bulk: bool = False,
+    ) -> T:
+        """Ejecuta `operation` sobre una conexión del pool con un canal reservado.
+
+        Si el servidor rechaza el canal, el pool ajusta el presupuesto de la
+        conexión y la operación se reintenta en otro canal. Con `bulk` usa la
+        conexión comprimida del perfil.
+        """
+        key, connector = self._lane(bulk)
+        for attempt in range(self._CHANNEL_OPEN_RETRIES + 1):
+            try:
+                async with self._pool.connection(key, connector) as conn:
+                    return await operation(conn)
+            except asyncssh.ChannelOpenError:
+                if attempt == self._CHANNEL_OPEN_RETRIES:
+                    raise
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _with_sftp(
+        self, operation: Callable[[asyncssh.SFTPClient], Awaitable[T]], bulk: bool = False
+    ) -> T:
+        """Ejecuta `operation` sobre la sesión SFTP cacheada de una conexión del pool.
+
+        Si la sesión estaba rota, el pool la descarta y la operación se reintenta
+        una vez sobre una sesión nueva. Con `bulk` usa la conexión comprimida.
+        """
+        key, connector = self._lane(bulk)
+        for attempt in range(2):
+            try:
+                async with self._pool.sftp(key, connector) as sftp:
+                    return await operation(sftp)
+            except SFTP_SESSION_ERRORS:
+                if attempt == 1:
+                    raise
+        raise AssertionError("unreachable")  # pragma: no cover
+
     async def execute(
         self, command: str, sudo: bool = False, timeout: int = 30
     ) -> tuple[int, str, str]:
@@ -96,15 +256,11 @@ class SSHConnectionAdapter(Connection):
             SSHConnectionError: Si la conexión falla o se pierde.
         """
         try:
-            conn = await self._get_connection()
             full_command = f"sudo {command}" if sudo else command
-            result = await conn.run(full_command, timeout=timeout)
-            rc = result.returncode if result.returncode is not None else -1
-            stdout = result.stdout if isinstance(
-                result.stdout, str) else bytes(result.stdout or b"").decode()
-            stderr = result.stderr if isinstance(
-                result.stderr, str) else bytes(result.stderr or b"").decode()
-            return rc, stdout, stderr
+            result = await self._with_channel(
+                lambda conn: conn.run(full_command, timeout=timeout)
+            )
+            return self._to_exec_tuple(result)
         except SSHConnectionError:
             raise
         except Exception as exc:
@@ -112,9 +268,110 @@ class SSHConnectionAdapter(Connection):
                 f"Error ejecutando comando en {self._host}: {exc}"
             ) from exc
 
+    @staticmethod
+    def _to_exec_tuple(result: asyncssh.SSHCompletedProcess) -> tuple[int, str, str]:
+        """Convierte un proceso terminado al contrato (return_code, stdout, stderr)."""
+        rc = result.returncode if result.returncode is not None else -1
+        stdout = result.stdout if isinstance(
+            result.stdout, str) else bytes(result.stdout or b"").decode(errors="replace")
+        stderr = result.stderr if isinstance(
+            result.stderr, str) else bytes(result.stderr or b"").decode(errors="replace")
+        return rc, stdout, stderr
+
+    async def stream(
+        self, command: str, sudo: bool = False, timeout: int = 30
+    ) -> AsyncIterator[OutputChunk]:
+        """Ejecuta un comando remoto y emite stdout/stderr a medida que llegan.
+
+        Args:
+            command: Comando a ejecutar.
+            sudo: Si True, antepone 'sudo' al comando.
+            timeout: Timeout de ejecución en segundos (default 30).
+
+        Yields:
+            OutputChunk en orden de llegada; el último con stream="exit".
+
+        Raises:
+            SSHConnectionError: Si la conexión falla, se pierde o se supera el timeout.
+        """
+        full_command = f"sudo {command}" if sudo else command
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        for attempt in range(self._CHANNEL_OPEN_RETRIES + 1):
+            try:
+                async with self._pool.connection(self._pool_key, self._connect) as conn:
+                    process = await conn.create_process(full_command)
+                    try:
+                        seq = 0
+                        async for name, data in iter_output(
+                            process.stdout, process.stderr, timeout=deadline - loop.time()
+                        ):
+                            yield OutputChunk(seq=seq, stream=name, data=data)
+                            seq += 1
+                        await asyncio.wait_for(
+                            process.wait_closed(), timeout=max(deadline - loop.time(), 0)
+                        )
+                        rc = process.returncode if process.returncode is not None else -1
+                        yield OutputChunk(seq=seq, stream="exit", data="", exit_code=rc)
+                    finally:
+                        # Cierra el canal si el consumidor abandona o hay timeout
+                        process.close()
+                return
+            except asyncssh.ChannelOpenError as exc:
+                if attempt == self._CHANNEL_OPEN_RETRIES:
+                    raise SSHConnectionError(
+                        f"Error ejecutando comando en {self._host}: {exc}"
+                    ) from exc
+            except SSHConnectionError:
+                raise
+            except asyncio.TimeoutError as exc:
+                raise SSHConnectionError(
+                    f"Timeout ({timeout}s) ejecutando comando en {self._host}"
+                ) from exc
+            except Exception as exc:
+                raise SSHConnectionError(
+                    f"Error ejecutando comando en {self._host}: {exc}"
+                ) from exc
+
+    @asynccontextmanager
+    async def session(self, sudo: bool = False) -> AsyncIterator[ShellSession]:
+        """Abre una sesión sobre un único shell remoto (elevado si sudo=True).
+
+        El shell ocupa un canal de la conexión del pool mientras dura la sesión.
+        Si no puede abrirse o se rompe, los comandos pasan a ejecutarse con execute().
+
+        Args:
+            sudo: Si True, el shell se lanza con `sudo sh`.
+
+        Yields:
+            ShellSession que ejecuta los comandos en orden.
+        """
+        session = SentinelShellSession(
+            open_shell=lambda: self._shell_process(sudo),
+            fallback=ExecShellSession(self, sudo=sudo),
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    @asynccontextmanager
+    async def _shell_process(self, sudo: bool) -> AsyncIterator[asyncssh.SSHClientProcess]:
+        """Reserva un canal del pool y lanza en él el shell de una sesión."""
+        async with self._pool.connection(self._pool_key, self._connect) as conn:
+            process = await conn.create_process("sudo sh" if sudo else "sh")
+            try:
+                yield process
+            finally:
+                process.close()
+
     async def upload_file(self, local_path: str, remote_path: str) -> None:
         """Transfiere un archivo local al servidor remoto vía SFTP.
 
+        Reutiliza la sesión SFTP cacheada en la conexión del pool (la comprimida
+        si el perfil de transporte lo pide para ese tamaño).
+
         Args:
             local_path: Ruta absoluta del archivo local.
             remote_path: Ruta destino en el servidor remoto.
@@ -123,10 +380,8 @@ class SSHConnectionAdapter(Connection):
             SSHConnectionError: Si la transferencia falla.
         """
         try:
-            conn = await self._get_connection()
-            sftp = await conn.start_sftp_client()
-            async with sftp:
-                await sftp.put(local_path, remote_path)
+            bulk = self._transport.compresses(self._local_size(local_path) or 0)
+            await self._with_sftp(lambda sftp: sftp.put(local_path, remote_path), bulk=bulk)
         except SSHConnectionError:
             raise
         except Exception as exc:
@@ -134,6 +389,197 @@ class SSHConnectionAdapter(Connection):
                 f"Error subiendo archivo a {self._host}: {exc}"
             ) from exc
 
+    async def upload_many(
+        self, pairs: Sequence[tuple[str, str]], concurrency: int = 8
+    ) -> list[FileTransferResult]:
+        """Transfiere varios archivos al servidor remoto por la misma sesión SFTP.
+
+        Los directorios destino se crean con un único `mkdir -p`. Después se
+        lanzan hasta `concurrency` puts a la vez sobre la sesión cacheada, de modo
+        que las peticiones de escritura de varios archivos viajan en paralelo en
+        lugar de esperar un round trip por archivo. Si la sesión se pierde a mitad
+        del lote, los archivos afectados se reintentan una vez en una sesión nueva.
+
+        Con muchos archivos pequeños (ver TAR_MIN_FILES / TAR_MAX_TOTAL_BYTES) usa
+        en su lugar un tar.gz generado al vuelo y extraído con `tar -x` en un
+        único canal, evitando el coste de metadatos SFTP por archivo.
+
+        Args:
+            pairs: Secuencia de tuplas (local_path, remote_path).
+            concurrency: Transferencias simultáneas máximas (default 8).
+
+        Returns:
+            Lista de FileTransferResult en el mismo orden que `pairs`.
+
+        Raises:
+            SSHConnectionError: Si la conexión falla o no se pueden crear los directorios.
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return []
+
+        try:
+            sizes = [self._local_size(local) for local, _ in pairs]
+            if self._should_use_tar(pairs, sizes):
+                return await self._upload_tar(pairs, sizes)
+
+            await self._make_remote_dirs(
+                {posixpath.dirname(remote) for _, remote in pairs}
+            )
+            results: list[FileTransferResult | None] = [None] * len(pairs)
+            pending = list(range(len(pairs)))
+            semaphore = asyncio.Semaphore(max(concurrency, 1))
+            key, connector = self._lane(
+                self._transport.compresses(sum(size or 0 for size in sizes))
+            )
+
+            for attempt in range(2):
+                try:
+                    async with self._pool.sftp(key, connector) as sftp:
+                        session_errors = await asyncio.gather(*(
+                            self._put_one(sftp, semaphore, pairs, index, results)
+                            for index in pending
+                        ))
+                        lost = next((exc for exc in session_errors if exc), None)
+                        if lost is not None:
+                            # Propaga para que el pool descarte la sesión rota
+                            raise lost
+                    break
+                except SFTP_SESSION_ERRORS:
+                    pending = [i for i in pending if not results[i].success]
+                    if attempt == 1:
+                        break
+
+            return [result for result in results if result is not None]
+        except SSHConnectionError:
+            raise
+        except Exception as exc:
+            raise SSHConnectionError(
+                f"Error subiendo archivos a {self._host}: {exc}"
+            ) from exc
+
+    @staticmethod
+    def _local_size(local_path: str) -> int | None:
+        """Tamaño del archivo local, o None si no existe o no es un archivo regular."""
+        try:
+            return os.path.getsize(local_path) if os.path.isfile(local_path) else None
+        except OSError:
+            return None
+
+    def _should_use_tar(
+        self, pairs: list[tuple[str, str]], sizes: list[int | None]
+    ) -> bool:
+        """Decide si el lote compensa enviarse como tar en lugar de por SFTP."""
+        present = [size for size in sizes if size is not None]
+        return (
+            len(present) >= self.TAR_MIN_FILES
+            and sum(present) <= self.TAR_MAX_TOTAL_BYTES
+            and all(posixpath.isabs(remote) for _, remote in pairs)
+        )
+
+    async def _upload_tar(
+        self, pairs: list[tuple[str, str]], sizes: list[int | None]
+    ) -> list[FileTransferResult]:
+        """Sube el lote como un tar.gz extraído bajo el directorio común de destino.
+
+        El éxito se decide con el mismo contrato que execute(): return code 0.
+        """
+        root = posixpath.commonpath([posixpath.dirname(remote) for _, remote in pairs])
+        entries = [
+            (local, posixpath.relpath(remote, root))
+            for (local, remote), size in zip(pairs, sizes)
+            if size is not None
+        ]
+        rc, _, stderr = await self._extract_tar(entries, root)
+
+        results = []
+        for (local, remote), size in zip(pairs, sizes):
+            if size is None:
+                results.append(FileTransferResult(
+                    local, remote, success=False, error="Archivo local no encontrado"
+                ))
+            elif rc == 0:
+                results.append(FileTransferResult(
+                    local, remote, success=True, bytes_transferred=size
+                ))
+            else:
+                results.append(FileTransferResult(
+                    local, remote, success=False,
+                    error=f"tar terminó con código {rc}: {stderr.strip()}",
+                ))
+        return results
+
+    async def _extract_tar(
+        self, entries: list[tuple[str, str]], root: str
+    ) -> tuple[int, str, str]:
+        """Envía el tar.gz por el stdin de `tar -x` en un canal del pool."""
+        quoted_root = shlex.quote(root)
+        # -o: no restaurar el propietario local de los archivos (GNU, BusyBox y bsdtar)
+        command = f"mkdir -p -- {quoted_root} && tar -xzof - -C {quoted_root}"
+
+        async def _run(conn: asyncssh.SSHClientConnection) -> asyncssh.SSHCompletedProcess:
+            process = await conn.create_process(command, encoding=None)
+            try:
+                try:
+                    async for chunk in iter_tar_gz(entries):
+                        process.stdin.write(chunk)
+                        await process.stdin.drain()
+                    process.stdin.write_eof()
+                except (BrokenPipeError, ConnectionResetError):
+                    # tar terminó antes de tiempo: su exit status explica el motivo
+                    pass
+                return await process.wait()
+            finally:
+                process.close()
+
+        # El tar ya va comprimido con gzip: no pasa por la conexión zlib
+        return self._to_exec_tuple(await self._with_channel(_run))
+
+    async def _make_remote_dirs(self, directories: set[str]) -> None:
+        """Crea todos los directorios remotos en una sola ejecución de `mkdir -p`."""
+        directories = {d for d in directories if d and d != "/"}
+        if not directories:
+            return
+        quoted = " ".join(shlex.quote(d) for d in sorted(directories))
+        rc, _, stderr = await self.execute(f"mkdir -p -- {quoted}")
+        if rc != 0:
+            raise SSHConnectionError(
+                f"No se pudieron crear los directorios remotos en {self._host}: {stderr.strip()}"
+            )
+
+    @staticmethod
+    async def _put_one(
+        sftp: asyncssh.SFTPClient,
+        semaphore: asyncio.Semaphore,
+        pairs: list[tuple[str, str]],
+        index: int,
+        results: list[FileTransferResult | None],
+    ) -> BaseException | None:
+        """Sube un archivo del lote y guarda su resultado en `results[index]`.
+
+        Devuelve la excepción si la sesión SFTP se perdió (para reintentar el
+        lote), None en cualquier otro caso.
+        """
+        local_path, remote_path = pairs[index]
+        async with semaphore:
+            try:
+                size = os.path.getsize(local_path)
+                await sftp.put(local_path, remote_path)
+            except SFTP_SESSION_ERRORS as exc:
+                results[index] = FileTransferResult(
+                    local_path, remote_path, success=False, error=str(exc)
+                )
+                return exc
+            except Exception as exc:
+                results[index] = FileTransferResult(
+                    local_path, remote_path, success=False, error=str(exc)
+                )
+                return None
+        results[index] = FileTransferResult(
+            local_path, remote_path, success=True, bytes_transferred=size
+        )
+        return None
+
     async def file_exists(self, remote_path: str) -> bool:
         """Comprueba si un archivo o directorio existe en el servidor remoto.
 
@@ -152,9 +598,129 @@ class SSHConnectionAdapter(Connection):
         except SSHConnectionError:
             raise
 
+    async def stat_many(
+        self, paths: Sequence[str], sha256: bool = False, timeout: int = 60
+    ) -> list[RemoteFileStat]:
+        """Consulta varios paths remotos con un único script de shell por lote.
+
+        Los paths viajan como argumentos posicionales de `sh -c`, así que no se
+        interpretan; solo se trocean en varios comandos (ejecutados en paralelo)
+        si la línea de comando superaría _STAT_MAX_COMMAND_BYTES.
+
+        Args:
+            paths: Rutas a consultar en el servidor remoto.
+            sha256: Si True, calcula además el SHA-256 de cada archivo regular.
+            timeout: Timeout de la consulta en segundos (default 60).
+
+        Returns:
+            Lista de RemoteFileStat en el mismo orden que `paths`.
+
+        Raises:
+            SSHConnectionError: Si la conexión falla o la salida no es la esperada.
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        batches = await asyncio.gather(*(
+            self._stat_batch(batch, sha256, timeout)
+            for batch in self._split_for_command_line(paths)
+        ))
+        return [stat for batch in batches for stat in batch]
+
+    def _split_for_command_line(self, paths: list[str]) -> list[list[str]]:
+        """Agrupa los paths en lotes cuyo comando cabe en _STAT_MAX_COMMAND_BYTES."""
+        budget = self._STAT_MAX_COMMAND_BYTES - len(_STAT_SCRIPT) - 64
+        batches: list[list[str]] = [[]]
+        used = 0
+        for path in paths:
+            size = len(shlex.quote(path).encode()) + 1
+            if batches[-1] and used + size > budget:
+                batches.append([])
+                used = 0
+            batches[-1].append(path)
+            used += size
+        return batches
+
+    async def _stat_batch(
+        self, paths: list[str], sha256: bool, timeout: int
+    ) -> list[RemoteFileStat]:
+        """Ejecuta el script de stat sobre un lote y parsea una línea por path."""
+        args = " ".join(shlex.quote(path) for path in paths)
+        command = f"SHA256={int(sha256)} sh -c {shlex.quote(_STAT_SCRIPT)} sh {args}"
+        rc, stdout, stderr = await self.execute(command, timeout=timeout)
+        lines = stdout.splitlines()
+        if rc != 0 or len(lines) != len(paths):
+            raise SSHConnectionError(
+                f"Respuesta inesperada consultando archivos en {self._host} "
+                f"(rc={rc}): {stderr.strip()}"
+            )
+
+        stats = []
+        for path, line in zip(paths, lines):
+            fields = line.split()
+            if fields[0] != "E":
+                stats.append(RemoteFileStat(path=path, exists=False))
+                continue
+            size, mtime, digest = fields[1:4]
+            stats.append(RemoteFileStat(
+                path=path,
+                exists=True,
+                size=int(size) if size != "-" else None,
+                mtime=float(mtime) if mtime != "-" else None,
+                sha256=digest if digest != "-" else None,
+            ))
+        return stats
+
+    async def measure_upload(self, payload: bytes) -> float:
+        """Envía `payload` a `cat > /dev/null` y mide cuánto tarda (micro-benchmark).
+
+        Usa la misma conexión que usaría una transferencia de ese tamaño, así que
+        refleja el cifrado, la compresión y la ventana del perfil de transporte.
+
+        Args:
+            payload: Bytes a enviar.
+
+        Returns:
+            Segundos desde que se abre el canal hasta que el remoto termina de leer.
+
+        Raises:
+            SSHConnectionError: Si la conexión falla o `cat` termina con error.
+        """
+        async def _run(conn: asyncssh.SSHClientConnection) -> float:
+            started = time.perf_counter()
+            process = await conn.create_process("cat > /dev/null", encoding=None)
+            try:
+                for offset in range(0, len(payload), CHUNK_SIZE):
+                    process.stdin.write(payload[offset:offset + CHUNK_SIZE])
+                    await process.stdin.drain()
+                process.stdin.write_eof()
+                result = await process.wait()
+            finally:
+                process.close()
+            if result.returncode != 0:
+                raise SSHConnectionError(
+                    f"El benchmark de transporte falló en {self._host}: "
+                    f"código {result.returncode}"
+                )
+            return time.perf_counter() - started
+
+        try:
+            return await self._with_channel(
+                _run, bulk=self._transport.compresses(len(payload))
+            )
+        except SSHConnectionError:
+            raise
+        except Exception as exc:
+            raise SSHConnectionError(
+                f"Error en el benchmark de transporte contra {self._host}: {exc}"
+            ) from exc
+
     async def close(self) -> None:
-        """Cierra la conexión SSH y libera los recursos."""
-        if self._conn is not None:
-            self._conn.close()
-            await self._conn.wait_closed()
-            self._conn = None
+        """Libera los recursos del adaptador.
+
+        Con el pool compartido no hay nada que cerrar: las conexiones ya se
+        devolvieron al terminar cada operación. Con un pool privado, lo drena.
+        """
+        if self._owns_pool:
+            await self._pool.close()
+            self._pool = SSHConnectionPool()
@@ -0,0 +1,546 @@
+"""SSHConnectionPool — Pool de conexiones SSH compartido por todo el proceso (ADR-003, RNF-03).
+
+Singleton creado en el Composition Root (main.py) y gestionado por el lifespan:
+`start()` arranca el reaper de conexiones idle y `close()` drena el pool al parar.
+
+Las conexiones se agrupan por clave (server_id + endpoint + versión de credencial).
+Cuando cambia la credencial o el host de un servidor la clave cambia, y las
+conexiones de la clave anterior se retiran en el siguiente acquire. Una misma
+clave puede tener varios carriles (`lane_key`, p.ej. la conexión comprimida de
+los perfiles de transporte "auto") que conviven sin retirarse entre sí.
+
+Multiplexación: una conexión SSH transporta varios canales de sesión a la vez.
+Cada préstamo reserva un canal de la conexión; varias operaciones concurrentes
+al mismo host comparten la misma conexión hasta agotar su presupuesto de canales
+(`max_channels_per_connection`, por defecto el MaxSessions de OpenSSH). Si el
+servidor rechaza un canal antes de llegar al presupuesto, el presupuesto de esa
+conexión se ajusta a lo que el servidor acepta realmente.
+
+Con el presupuesto agotado los llamantes esperan en una cola FIFO. Solo se abre
+otra conexión al mismo host cuando la cola supera `spill_queue_threshold`.
+
+SFTP: cada conexión guarda una sesión SFTP creada bajo demanda y compartida por
+todas las transferencias (SFTP admite peticiones concurrentes en un canal). La
+sesión ocupa un canal del presupuesto, se recrea si se rompe y se cierra junto
+con la conexión.
+
+Reglas:
+- Idle máximo `idle_timeout` segundos (default 5 min) antes de cerrarse.
+- Máximo `max_connections_per_host` conexiones abiertas por clave.
+- Comprobación de liveness antes de reutilizar una conexión.
+- El pool no sabe conectar: el adaptador pasa un `connector` con sus parámetros.
+"""
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+
+import asyncssh
+
+from app.v1.servers.infrastructure.exceptions import SSHConnectionError
+from app.v1.shared.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+Connector = Callable[[], Awaitable[asyncssh.SSHClientConnection]]
+
+# Valor por defecto de MaxSessions en sshd_config de OpenSSH
+DEFAULT_MAX_CHANNELS_PER_CONNECTION = 10
+
+# Errores que indican que la sesión SFTP cacheada ya no es utilizable
+SFTP_SESSION_ERRORS = (
+    asyncssh.SFTPConnectionLost,
+    asyncssh.SFTPNoConnection,
+    asyncssh.ConnectionLost,
+    asyncssh.ChannelOpenError,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+@dataclass(eq=False)
+class PooledConnection:
+    """Conexión SSH gestionada por el pool con su contabilidad de canales."""
+
+    conn: asyncssh.SSHClientConnection
+    max_channels: int = DEFAULT_MAX_CHANNELS_PER_CONNECTION
+    in_use: int = 0
+    retired: bool = False
+    last_used: float = field(default_factory=time.monotonic)
+    sftp: asyncssh.SFTPClient | None = None
+    sftp_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def has_capacity(self) -> bool:
+        # La sesión SFTP cacheada ocupa un canal mientras está abierta
+        channels = self.in_use + (1 if self.sftp is not None else 0)
+        return not self.retired and channels < self.max_channels
+
+
+class _HostPool:
+    """Estado del pool para una clave concreta (un servidor con una versión de credencial)."""
+
+    def __init__(self, server_id: str) -> None:
+        self.server_id = server_id
+        self.conns: list[PooledConnection] = []
+        self.opening = 0
+        # Futures de los llamantes en espera; se resuelven con un canal reservado
+        # o con None para indicar "reintenta" (p. ej. hay hueco para conectar).
+        self.waiters: deque[asyncio.Future] = deque()
+
+    def live_count(self) -> int:
+        return len([entry for entry in self.conns if not entry.retired]) + self.opening
+
+
+class SSHConnectionPool:
+    """Pool de conexiones asyncssh multiplexadas, indexado por servidor."""
+
+    def __init__(
+        self,
+        idle_timeout: float = 300,
+        max_connections_per_host: int = 5,
+        acquire_timeout: float = 30,
+        reap_interval: float = 60,
+        max_channels_per_connection: int = DEFAULT_MAX_CHANNELS_PER_CONNECTION,
+        spill_queue_threshold: int = 4,
+    ) -> None:
+        """Inicializa el pool.
+
+        Args:
+            idle_timeout: Segundos que una conexión puede estar sin canales antes de cerrarse (default 300).
+            max_connections_per_host: Conexiones abiertas máximas por clave (default 5).
+            acquire_timeout: Segundos máximos esperando un canal libre (default 30).
+            reap_interval: Cada cuántos segundos se ejecuta el reaper de idle (default 60).
+            max_channels_per_connection: Canales concurrentes por conexión; debe ser
+                <= MaxSessions del servidor (default 10).
+            spill_queue_threshold: Llamantes en cola a partir de los cuales se abre
+                una conexión adicional al mismo host (default 4).
+        """
+        self._idle_timeout = idle_timeout
+        self._max_per_host = max_connections_per_host
+        self._acquire_timeout = acquire_timeout
+        self._reap_interval = reap_interval
+        self._max_channels = max_channels_per_connection
+        self._spill_threshold = spill_queue_threshold
+        self._hosts: dict[str, _HostPool] = {}
+        self._reaper: asyncio.Task | None = None
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Claves
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(
+        server_id: str,
+        host: str,
+        port: int,
+        credential_version: str,
+        transport_profile: str = "default",
+    ) -> str:
+        """Construye la clave del pool para un servidor.
+
+        Args:
+            server_id: ID del servidor.
+            host: Host SSH del servidor.
+            port: Puerto SSH del servidor.
+            credential_version: Identificador de la versión de la credencial
+                (ej: "{credential_id}@{updated_at}").
+            transport_profile: Perfil de transporte con el que se negocian las
+                conexiones; cambiarlo no reutiliza las ya abiertas.
+
+        Returns:
+            Clave estable mientras no cambien endpoint, credencial ni perfil.
+        """
+        return f"{server_id}|{host}:{port}|{credential_version}|{transport_profile}"
+
+    @staticmethod
+    def lane_key(key: str, lane: str) -> str:
+        """Clave de un carril adicional de conexiones para la misma clave base."""
+        return f"{key}#{lane}"
+
+    @staticmethod
+    def _server_id_from_key(key: str) -> str:
+        return key.split("|", 1)[0]
+
+    @staticmethod
+    def _base_key(key: str) -> str:
+        return key.split("#", 1)[0]
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Arranca la tarea de fondo que cierra las conexiones idle caducadas."""
+        if self._reaper is None:
+            self._closed = False
+            self._reaper = asyncio.create_task(self._reap_forever())
+
+    async def close(self) -> None:
+        """Drena el pool: cierra las conexiones sin canales y marca el pool como cerrado.
+
+        Los llamantes en cola reciben SSHConnectionError. Las conexiones con
+        canales abiertos se cierran cuando se devuelve su último canal.
+        """
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reaper
+            self._reaper = None
+
+        for key, host in list(self._hosts.items()):
+            while host.waiters:
+                waiter = host.waiters.popleft()
+                if not waiter.done():
+                    waiter.set_exception(
+                        SSHConnectionError("El pool de conexiones SSH está cerrado")
+                    )
+            idle = [entry for entry in host.conns if entry.in_use == 0]
+            for entry in host.conns:
+                entry.retired = True
+            host.conns = [entry for entry in host.conns if entry.in_use > 0]
+            for entry in idle:
+                await self._close_quietly(entry)
+            logger.debug("ssh_pool_drained", key=key, closed=len(idle))
+
+    # ------------------------------------------------------------------
+    # Préstamo / devolución de canales
+    # ------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def connection(
+        self, key: str, connector: Connector
+    ) -> AsyncIterator[asyncssh.SSHClientConnection]:
+        """Reserva un canal de una conexión durante el bloque `async with`.
+
+        Si el servidor rechaza abrir el canal (MaxSessions inferior al presupuesto),
+        el presupuesto de la conexión se ajusta y la excepción se propaga para que
+        el llamante reintente.
+
+        Args:
+            key: Clave del pool (ver make_key).
+            connector: Corrutina que abre una conexión nueva si hace falta.
+
+        Yields:
+            Conexión asyncssh sobre la que abrir un canal.
+
+        Raises:
+            SSHConnectionError: Si el pool está cerrado o no hay canal tras acquire_timeout.
+        """
+        entry = await self.acquire(key, connector)
+        try:
+            yield entry.conn
+        except asyncssh.ChannelOpenError:
+            self._shrink_budget(key, entry)
+            raise
+        finally:
+            await self.release(key, entry)
+
+    @asynccontextmanager
+    async def sftp(self, key: str, connector: Connector) -> AsyncIterator[asyncssh.SFTPClient]:
+        """Presta la sesión SFTP cacheada de una conexión del pool.
+
+        La sesión se crea en el primer uso y se reutiliza entre transferencias.
+        Si la operación falla con un error de sesión, la sesión se descarta para
+        que el siguiente préstamo la reconstruya, y la excepción se propaga.
+
+        Raises:
+            SSHConnectionError: Si el pool está cerrado o no hay canal tras acquire_timeout.
+        """
+        entry = await self.acquire(key, connector)
+        try:
+            client = await self._get_sftp(entry)
+            try:
+                yield client
+            except SFTP_SESSION_ERRORS:
+                await self._drop_sftp(entry, client)
+                raise
+        except asyncssh.ChannelOpenError:
+            self._shrink_budget(key, entry)
+            raise
+        finally:
+            await self.release(key, entry)
+
+    async def acquire(self, key: str, connector: Connector) -> PooledConnection:
+        """Reserva un canal en una conexión viva, esperando en cola FIFO si hace falta.
+
+        Raises:
+            SSHConnectionError: Si el pool está cerrado o no hay canal tras acquire_timeout.
+        """
+        await self._retire_superseded(key)
+        host = self._hosts.setdefault(key, _HostPool(self._server_id_from_key(key)))
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._acquire_timeout
+
+        while True:
+            if self._closed:
+                raise SSHConnectionError("El pool de conexiones SSH está cerrado")
+            await self._prune_dead(host)
+
+            # Respetar el orden de llegada: solo se salta la cola si está vacía
+            if not host.waiters:
+                entry = self._pick(host)
+                if entry is not None:
+                    entry.in_use += 1
+                    logger.debug("ssh_pool_reuse", key=key, channels=entry.in_use)
+                    return entry
+
+            if self._should_open(host):
+                return await self._open(key, host, connector)
+
+            waiter = loop.create_future()
+            host.waiters.append(waiter)
+            remaining = deadline - loop.time()
+            try:
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                entry = await asyncio.wait_for(waiter, timeout=remaining)
+            except asyncio.TimeoutError:
+                granted = self._granted(waiter)
+                if granted is not None:
+                    # El canal llegó a la vez que el timeout: se usa
+                    return granted
+                logger.warning(
+                    "ssh_pool_exhausted",
+                    key=key,
+                    connections=len(host.conns),
+                    waiting=len(host.waiters),
+                )
+                raise SSHConnectionError(
+                    f"Pool SSH agotado para {key}: sin canales libres "
+                    f"en {len(host.conns)} conexiones"
+                ) from None
+            except asyncio.CancelledError:
+                granted = self._granted(waiter)
+                if granted is not None:
+                    # Cancelado tras recibir canal: devolverlo para no perderlo
+                    granted.in_use -= 1
+                    self._dispatch(host)
+                raise
+            finally:
+                with suppress(ValueError):
+                    host.waiters.remove(waiter)
+
+            if entry is not None:
+                return entry
+
+    async def release(self, key: str, entry: PooledConnection, discard: bool = False) -> None:
+        """Devuelve un canal al pool y lo cede al primer llamante en cola.
+
+        Args:
+            key: Clave con la que se obtuvo el canal.
+            entry: Conexión cuyo canal se devuelve.
+            discard: Si True, la conexión se retira: no admite más canales y se
+                cierra en cuanto se devuelva el último.
+        """
+        entry.in_use -= 1
+        entry.last_used = time.monotonic()
+        if discard or self._closed or not self._is_alive(entry.conn):
+            entry.retired = True
+
+        host = self._hosts.get(key)
+        if entry.retired and entry.in_use <= 0:
+            if host is not None and entry in host.conns:
+                host.conns.remove(entry)
+            await self._close_quietly(entry)
+
+        if host is not None:
+            self._dispatch(host)
+
+    # ------------------------------------------------------------------
+    # Mantenimiento
+    # ------------------------------------------------------------------
+
+    async def evict_idle(self) -> int:
+        """Cierra las conexiones sin canales abiertos que superan idle_timeout.
+
+        Returns:
+            Número de conexiones cerradas.
+        """
+        now = time.monotonic()
+        expired: list[PooledConnection] = []
+        for key, host in list(self._hosts.items()):
+            for entry in list(host.conns):
+                if entry.in_use > 0:
+                    continue
+                if now - entry.last_used > self._idle_timeout or not self._is_alive(entry.conn):
+                    host.conns.remove(entry)
+                    expired.append(entry)
+            if not host.conns and not host.opening and not host.waiters:
+                del self._hosts[key]
+
+        for entry in expired:
+            await self._close_quietly(entry)
+        if expired:
+            logger.debug("ssh_pool_idle_evicted", closed=len(expired))
+        return len(expired)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Devuelve por clave conexiones abiertas, idle, canales en uso y llamantes en cola."""
+        return {
+            key: {
+                "open": len(host.conns),
+                "idle": len([entry for entry in host.conns if entry.in_use == 0]),
+                "channels": sum(entry.in_use for entry in host.conns),
+                "waiting": len(host.waiters),
+            }
+            for key, host in self._hosts.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    def _pick(self, host: _HostPool) -> PooledConnection | None:
+        """Elige la conexión viva con capacidad y menos canales en uso."""
+        candidates = [
+            entry for entry in host.conns if entry.has_capacity() and self._is_alive(entry.conn)
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda entry: entry.in_use)
+
+    def _should_open(self, host: _HostPool) -> bool:
+        """Decide si abrir otra conexión o esperar en cola."""
+        live = host.live_count()
+        if live == 0:
+            return True
+        if live >= self._max_per_host:
+            return False
+        # Solo se desborda a otra conexión cuando la cola ya es larga
+        return len(host.waiters) >= self._spill_threshold
+
+    async def _open(self, key: str, host: _HostPool, connector: Connector) -> PooledConnection:
+        host.opening += 1
+        try:
+            conn = await connector()
+        except BaseException:
+            host.opening -= 1
+            # Otro llamante en cola puede intentar conectar
+            self._wake_one(host)
+            raise
+        host.opening -= 1
+
+        entry = PooledConnection(conn=conn, max_channels=self._max_channels, in_use=1)
+        host.conns.append(entry)
+        logger.debug("ssh_pool_connect", key=key, connections=len(host.conns))
+        self._dispatch(host)
+        return entry
+
+    def _dispatch(self, host: _HostPool) -> None:
+        """Cede canales libres a los llamantes en cola, en orden de llegada."""
+        while host.waiters:
+            waiter = host.waiters[0]
+            if waiter.done():
+                host.waiters.popleft()
+                continue
+            entry = self._pick(host)
+            if entry is None:
+                if self._should_open(host) and not host.opening:
+                    # Hay hueco para otra conexión: que el primero de la cola conecte
+                    host.waiters.popleft()
+                    waiter.set_result(None)
+                break
+            host.waiters.popleft()
+            entry.in_use += 1
+            waiter.set_result(entry)
+
+    @staticmethod
+    def _granted(waiter: asyncio.Future) -> PooledConnection | None:
+        """Devuelve el canal asignado a un waiter ya resuelto, si lo hay."""
+        if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+            return waiter.result()
+        return None
+
+    async def _get_sftp(self, entry: PooledConnection) -> asyncssh.SFTPClient:
+        """Devuelve la sesión SFTP de la conexión, creándola si no existe."""
+        async with entry.sftp_lock:
+            if entry.sftp is None:
+                entry.sftp = await entry.conn.start_sftp_client()
+                logger.debug("ssh_pool_sftp_started")
+            return entry.sftp
+
+    async def _drop_sftp(self, entry: PooledConnection, client: asyncssh.SFTPClient) -> None:
+        """Descarta una sesión SFTP rota (si sigue siendo la cacheada)."""
+        async with entry.sftp_lock:
+            if entry.sftp is client:
+                entry.sftp = None
+        await self._close_sftp_quietly(client)
+        logger.debug("ssh_pool_sftp_dropped")
+
+    def _wake_one(self, host: _HostPool) -> None:
+        while host.waiters:
+            waiter = host.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _shrink_budget(self, key: str, entry: PooledConnection) -> None:
+        """Ajusta el presupuesto de canales al límite real del servidor (MaxSessions)."""
+        accepted = max(1, entry.in_use - 1)
+        if accepted < entry.max_channels:
+            entry.max_channels = accepted
+            logger.info("ssh_pool_channel_budget_reduced", key=key, max_channels=accepted)
+
+    async def _prune_dead(self, host: _HostPool) -> None:
+        dead = [
+            entry for entry in host.conns
+            if entry.in_use == 0 and (entry.retired or not self._is_alive(entry.conn))
+        ]
+        for entry in dead:
+            host.conns.remove(entry)
+            await self._close_quietly(entry)
+
+    async def _retire_superseded(self, key: str) -> None:
+        """Retira las conexiones de claves anteriores del mismo servidor."""
+        if key in self._hosts:
+            return
+        server_id = self._server_id_from_key(key)
+        base_key = self._base_key(key)
+        for old_key, host in list(self._hosts.items()):
+            # Otro carril de la misma clave base no es una versión anterior
+            if host.server_id != server_id or self._base_key(old_key) == base_key:
+                continue
+            for entry in host.conns:
+                entry.retired = True
+            await self._prune_dead(host)
+            if not host.conns and not host.opening and not host.waiters:
+                self._hosts.pop(old_key, None)
+
+    async def _reap_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self._reap_interval)
+            try:
+                await self.evict_idle()
+            except Exception as exc:  # pragma: no cover - el reaper nunca debe morir
+                logger.error("ssh_pool_reaper_failed", error=str(exc))
+
+    @staticmethod
+    def _is_alive(conn: asyncssh.SSHClientConnection) -> bool:
+        try:
+            return not conn.is_closed()
+        except Exception:
+            return False
+
+    @classmethod
+    async def _close_quietly(cls, entry: PooledConnection) -> None:
+        """Cierra la sesión SFTP cacheada y después la conexión."""
+        if entry.sftp is not None:
+            client, entry.sftp = entry.sftp, None
+            await cls._close_sftp_quietly(client)
+        try:
+            entry.conn.close()
+            await entry.conn.wait_closed()
+        except Exception as exc:
+            logger.debug("ssh_pool_close_failed", error=str(exc))
+
+    @staticmethod
+    async def _close_sftp_quietly(client: asyncssh.SFTPClient) -> None:
+        try:
+            client.exit()
+            await client.wait_closed()
+        except Exception as exc:
+            logger.debug("ssh_pool_sftp_close_failed", error=str(exc))
@@ -0,0 +1,127 @@
+"""Perfiles de transporte SSH — opciones de asyncssh.connect() por servidor.
+
+Cada Server guarda el nombre de su perfil (TransportProfile) y ConnectionFactory
+lo resuelve aquí para construir el SSHConnectionAdapter:
+
+- default: los valores por defecto de asyncssh (comportamiento histórico).
+- lan: cifrados AEAD baratos en CPU (AES-GCM con AES-NI), sin compresión y
+  ventanas grandes; para hosts en la misma red.
+- wan: chacha20/AES-GCM, compresión zlib solo para transferencias grandes,
+  keepalive agresivo para detectar antes enlaces caídos y ventana amplia para
+  enlaces con mucha latencia.
+
+Compresión:
+- "on": toda conexión negocia zlib.
+- "off": nunca se comprime.
+- "auto": SSH negocia la compresión al conectar y no puede cambiarla después,
+  así que el adaptador usa dos conexiones en el pool: una sin comprimir para
+  comandos y transferencias pequeñas, y otra con zlib para las transferencias
+  de al menos `compression_min_bytes`.
+"""
+from dataclasses import dataclass
+
+COMPRESSION_ON = "on"
+COMPRESSION_OFF = "off"
+COMPRESSION_AUTO = "auto"
+
+_ZLIB_ALGS = ("zlib@openssh.com", "zlib", "none")
+_NO_COMPRESSION_ALGS = ("none",)
+
+
+@dataclass(frozen=True)
+class SSHTransportProfile:
+    """Preferencias de algoritmos, compresión, keepalive y ventana de una conexión.
+
+    Las tuplas vacías y los None dejan el valor por defecto de asyncssh.
+    """
+
+    name: str
+    encryption_algs: tuple[str, ...] = ()
+    mac_algs: tuple[str, ...] = ()
+    kex_algs: tuple[str, ...] = ()
+    compression: str | None = None
+    compression_min_bytes: int = 1024 * 1024
+    keepalive_interval: int | None = None
+    keepalive_count_max: int | None = None
+    window: int | None = None
+    max_pktsize: int | None = None
+
+    @property
+    def splits_compression(self) -> bool:
+        """True si el perfil mantiene una conexión comprimida aparte para bulk."""
+        return self.compression == COMPRESSION_AUTO
+
+    def compresses(self, payload_bytes: int) -> bool:
+        """Indica si una transferencia de ese tamaño debe ir por la conexión comprimida."""
+        return self.splits_compression and payload_bytes >= self.compression_min_bytes
+
+    def connect_options(self, compressed: bool = False) -> dict:
+        """Traduce el perfil a kwargs de asyncssh.connect().
+
+        Args:
+            compressed: En perfiles "auto", construye la variante comprimida.
+
+        Returns:
+            Diccionario con solo las opciones que el perfil fija.
+        """
+        options: dict = {}
+        for option in ("encryption_algs", "mac_algs", "kex_algs"):
+            algs = getattr(self, option)
+            if algs:
+                options[option] = list(algs)
+
+        if self.compression == COMPRESSION_ON or (self.splits_compression and compressed):
+            options["compression_algs"] = list(_ZLIB_ALGS)
+        elif self.compression is not None:
+            options["compression_algs"] = list(_NO_COMPRESSION_ALGS)
+
+        for option in ("keepalive_interval", "keepalive_count_max", "window", "max_pktsize"):
+            value = getattr(self, option)
+            if value is not None:
+                options[option] = value
+        return options
+
+
+DEFAULT_PROFILE = SSHTransportProfile(name="default")
+
+TRANSPORT_PROFILES: dict[str, SSHTransportProfile] = {
+    "default": DEFAULT_PROFILE,
+    "lan": SSHTransportProfile(
+        name="lan",
+        encryption_algs=(
+            "aes128-gcm@openssh.com",
+            "aes256-gcm@openssh.com",
+            "chacha20-poly1305@openssh.com",
+            "aes128-ctr",
+        ),
+        mac_algs=("hmac-sha2-256-etm@openssh.com", "hmac-sha2-256"),
+        kex_algs=("curve25519-sha256", "curve25519-sha256@libssh.org", "ecdh-sha2-nistp256"),
+        compression=COMPRESSION_OFF,
+        keepalive_interval=60,
+        keepalive_count_max=3,
+        window=8 * 1024 * 1024,
+        max_pktsize=64 * 1024,
+    ),
+    "wan": SSHTransportProfile(
+        name="wan",
+        encryption_algs=(
+            "chacha20-poly1305@openssh.com",
+            "aes128-gcm@openssh.com",
+            "aes256-gcm@openssh.com",
+            "aes128-ctr",
+        ),
+        mac_algs=("hmac-sha2-256-etm@openssh.com", "hmac-sha2-256"),
+        kex_algs=("curve25519-sha256", "curve25519-sha256@libssh.org", "ecdh-sha2-nistp256"),
+        compression=COMPRESSION_AUTO,
+        compression_min_bytes=256 * 1024,
+        keepalive_interval=15,
+        keepalive_count_max=4,
+        window=16 * 1024 * 1024,
+        max_pktsize=32 * 1024,
+    ),
+}
+
+
+def get_transport_profile(name: str | None) -> SSHTransportProfile:
+    """Devuelve el perfil con ese nombre, o el default si no existe o es None."""
+    return TRANSPORT_PROFILES.get(name or "default", DEFAULT_PROFILE)
@@ -0,0 +1,102 @@
+"""Generación al vuelo de un tar.gz para Connection.upload_many() en modo tar.
+
+El archivo nunca toca disco: un hilo escribe el tar con tarfile en modo stream
+("w|gz") sobre un writer que deposita los bloques en una cola acotada, y el
+consumidor async los envía por el canal SSH. Si el canal va lento, la cola se
+llena y el hilo se bloquea en lugar de acumular el archivo en memoria.
+"""
+import asyncio
+import concurrent.futures
+import io
+import tarfile
+import threading
+from collections.abc import AsyncIterator, Sequence
+
+MAX_BUFFERED_CHUNKS = 16
+# Intervalo con el que el hilo productor comprueba si el consumidor abandonó
+_ABORT_POLL_SECONDS = 0.1
+
+
+class _TarAborted(Exception):
+    """El consumidor dejó de leer; el hilo productor debe terminar."""
+
+
+class _QueueWriter(io.RawIOBase):
+    """File object de solo escritura que entrega cada bloque a una asyncio.Queue."""
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, stop: threading.Event
+    ) -> None:
+        super().__init__()
+        self._loop = loop
+        self._queue = queue
+        self._stop = stop
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        if self._stop.is_set():
+            raise _TarAborted
+        chunk = bytes(data)
+        future = asyncio.run_coroutine_threadsafe(self._queue.put(chunk), self._loop)
+        while True:
+            try:
+                future.result(timeout=_ABORT_POLL_SECONDS)
+                return len(chunk)
+            except concurrent.futures.TimeoutError:
+                if self._stop.is_set():
+                    future.cancel()
+                    raise _TarAborted from None
+
+
+async def iter_tar_gz(entries: Sequence[tuple[str, str]]) -> AsyncIterator[bytes]:
+    """Itera los bloques de un tar.gz con los archivos indicados.
+
+    Args:
+        entries: Tuplas (ruta_local, nombre_en_el_archivo). El nombre es relativo
+            al directorio donde se extraerá el tar.
+
+    Yields:
+        Bloques de bytes del tar.gz en orden.
+
+    Raises:
+        OSError: Si no se puede leer alguno de los archivos locales.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_BUFFERED_CHUNKS)
+    stop = threading.Event()
+
+    def _produce() -> None:
+        writer = _QueueWriter(loop, queue, stop)
+        with tarfile.open(fileobj=writer, mode="w|gz") as tar:
+            for local_path, arcname in entries:
+                tar.add(local_path, arcname=arcname, recursive=False)
+
+    async def _run_producer() -> None:
+        try:
+            await asyncio.to_thread(_produce)
+        except _TarAborted:
+            return
+        except Exception as exc:
+            await queue.put(exc)
+            return
+        await queue.put(None)
+
+    producer = asyncio.create_task(_run_producer())
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # Vacía la cola para que el hilo no quede bloqueado en un put pendiente
+        while not producer.done():
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.sleep(_ABORT_POLL_SECONDS / 2)
+        await asyncio.gather(producer, return_exceptions=True)
@@ -53,6 +53,8 @@ class ServerModel(Base):
     os_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
     os_version: Mapped[str | None] = mapped_column(String(100), nullable=True)
     os_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    transport_profile: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="default", server_default="default")
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
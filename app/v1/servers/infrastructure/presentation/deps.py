@@ -58,6 +58,26 @@ def get_event_bus(request: Request):
     return request.app.state.event_bus
 
 
+def get_ssh_connection_pool(request: Request):
+    """Retorna el SSHConnectionPool singleton depositado en app.state por main.py."""
+    return request.app.state.ssh_connection_pool
+
+
+def get_credential_cache(request: Request):
+    """Retorna el InMemoryCredentialCache singleton depositado en app.state por main.py."""
+    return request.app.state.credential_cache
+
+
+def get_ssh_connect_governor(request: Request):
+    """Retorna el SSHConnectGovernor singleton depositado en app.state por main.py."""
+    return request.app.state.ssh_connect_governor
+
+
+def get_circuit_breaker(request: Request):
+    """Retorna el ValkeyCircuitBreaker singleton depositado en app.state por main.py."""
+    return request.app.state.circuit_breaker
+
+
 def get_encryption_key(request: Request) -> str:
     """Retorna la ENCRYPTION_KEY desde app.state."""
     return request.app.state.encryption_key
@@ -116,9 +136,19 @@ def get_group_repository(
 
 def get_connection_factory(
     credential_repo: Annotated[SQLAlchemyCredentialRepository, Depends(get_credential_repository)],
+    connection_pool=Depends(get_ssh_connection_pool),
+    credential_cache=Depends(get_credential_cache),
+    connect_governor=Depends(get_ssh_connect_governor),
+    circuit_breaker=Depends(get_circuit_breaker),
 ) -> ConnectionFactoryAdapter:
-    """Construye ConnectionFactory con el repositorio de credenciales scoped al request."""
-    return ConnectionFactoryAdapter(credential_repository=credential_repo)
+    """Construye ConnectionFactory con el repositorio scoped y los singletons SSH."""
+    return ConnectionFactoryAdapter(
+        credential_repository=credential_repo,
+        connection_pool=connection_pool,
+        credential_cache=credential_cache,
+        connect_governor=connect_governor,
+        circuit_breaker=circuit_breaker,
+    )
 
 
 # ---------------------------------------------------------------------------
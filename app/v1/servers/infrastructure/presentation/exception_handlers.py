@@ -12,6 +12,7 @@ Jerarquía y códigos HTTP:
   - DuplicateLocalServerError           → 409 Conflict
   - ServerInUseError                    → 409 Conflict
   - GroupInUseError                     → 409 Conflict
+  - ServerCircuitOpenError              → 503 Service Unavailable (+ Retry-After)
 - InfrastructureException               → 500 Internal Server Error
 """
 from fastapi import FastAPI, Request
@@ -21,6 +22,7 @@ from app.v1.servers.application.exceptions import (
     DuplicateLocalServerError,
     GroupInUseError,
     LocalServerNotAllowedInGroupError,
+    ServerCircuitOpenError,
     ServerInUseError,
     UnauthorizedOperationError,
     UseCaseException,
@@ -203,6 +205,26 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"detail": str(exc)},
         )
 
+    # ── 503 Service Unavailable ──────────────────────────────────────────────
+
+    @app.exception_handler(ServerCircuitOpenError)
+    async def server_circuit_open_handler(
+        request: Request, exc: ServerCircuitOpenError
+    ) -> JSONResponse:
+        """Convierte ServerCircuitOpenError a HTTP 503 con Retry-After."""
+        logger.warning(
+            "server_circuit_open",
+            path=request.url.path,
+            server_id=exc.server_id,
+            circuit_state=exc.state,
+            retry_after=exc.retry_after,
+        )
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(exc), "circuit_state": exc.state},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     # ── 400 Bad Request ───────────────────────────────────────────────────────
 
     @app.exception_handler(DomainException)
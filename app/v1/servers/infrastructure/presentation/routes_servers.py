@@ -95,6 +95,7 @@ def _to_server_response(result) -> ServerResponse:
         os_name=result.os_name,
         created_at=result.created_at,
         updated_at=result.updated_at,
+        transport_profile=result.transport_profile,
     )
 
 
@@ -219,6 +220,7 @@ async def update_server(
         credential_id=body.credential_id,
         description=body.description,
         correlation_id=correlation_id,
+        transport_profile=body.transport_profile,
     )
     logger.info(
         "server_updated",
@@ -298,6 +300,7 @@ async def check_server_health(
 
     Returns:
         200 HealthCheckResponse con status online/offline, latency_ms y OS info.
+        Si el circuit breaker del servidor está abierto: offline con circuit_state.
 
     Raises:
         404 si el servidor no existe o no pertenece al usuario.
@@ -316,6 +319,7 @@ async def check_server_health(
         os_id=result.os_id,
         os_version=result.os_version,
         os_name=result.os_name,
+        circuit_state=result.circuit_state,
     )
 
 
@@ -105,6 +105,7 @@ class UpdateServerRequest(BaseModel):
     port: int | None = Field(None, ge=1, le=65535)
     credential_id: str | None = Field(None)
     description: str | None = Field(None, max_length=1024)
+    transport_profile: str | None = Field(None, examples=["wan"])
 
 
 class ToggleServerStatusRequest(BaseModel):
@@ -135,6 +136,7 @@ class ServerResponse(BaseModel):
     os_name: str | None
     created_at: datetime
     updated_at: datetime
+    transport_profile: str = "default"
 
     model_config = {"from_attributes": True}
 
@@ -157,6 +159,7 @@ class HealthCheckResponse(BaseModel):
     os_id: str | None
     os_version: str | None
     os_name: str | None
+    circuit_state: str | None = None
 
 
 # ---------------------------------------------------------------------------
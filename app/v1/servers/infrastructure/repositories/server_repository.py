@@ -8,6 +8,7 @@ from app.v1.servers.application.interfaces.server_repository import ServerReposi
 from app.v1.servers.domain.entities.server import Server
 from app.v1.servers.domain.value_objects.server_status import ServerStatus
 from app.v1.servers.domain.value_objects.server_type import ServerType
+from app.v1.servers.domain.value_objects.transport_profile import TransportProfile
 from app.v1.servers.infrastructure.exceptions import DatabaseQueryError
 from app.v1.servers.infrastructure.persistence.models import ServerModel
 
@@ -41,6 +42,7 @@ class SQLAlchemyServerRepository(ServerRepository):
             os_id=server.os_id,
             os_version=server.os_version,
             os_name=server.os_name,
+            transport_profile=server.transport_profile.value,
             created_at=server.created_at,
             updated_at=server.updated_at,
         )
@@ -59,6 +61,7 @@ class SQLAlchemyServerRepository(ServerRepository):
             os_id=model.os_id,
             os_version=model.os_version,
             os_name=model.os_name,
+            transport_profile=TransportProfile(model.transport_profile),
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -146,6 +149,7 @@ class SQLAlchemyServerRepository(ServerRepository):
             model.os_id = server.os_id
             model.os_version = server.os_version
             model.os_name = server.os_name
+            model.transport_profile = server.transport_profile.value
             model.updated_at = server.updated_at
 
             await self._session.commit()
@@ -0,0 +1 @@
+"""Services - Servicios de infraestructura para servers."""
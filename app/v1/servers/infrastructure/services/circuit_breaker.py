@@ -0,0 +1,134 @@
+"""ValkeyCircuitBreaker — Circuit breaker por servidor compartido entre réplicas.
+
+Evita pagar el connect_timeout completo en cada intento contra un host caído.
+El estado vive en Valkey para que todas las réplicas de la API lo compartan:
+
+- circuit:{server_id}:failures — fallos consecutivos (TTL failure_window).
+- circuit:{server_id}:open     — presente mientras el breaker está abierto (TTL cooldown).
+- circuit:{server_id}:tripped  — el breaker se abrió y aún no se ha cerrado.
+  Si existe sin `open`, el estado es half_open.
+- circuit:{server_id}:probe    — lock SET NX de la única sonda permitida en half_open.
+
+Si Valkey no responde, el breaker deja pasar las llamadas: una caída de la
+caché no debe impedir conectar a los servidores.
+"""
+from typing import Any
+
+from app.v1.servers.application.exceptions import ServerCircuitOpenError
+from app.v1.servers.application.interfaces.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+)
+from app.v1.shared.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+# El marcador tripped caduca solo si nadie vuelve a intentar conectar en un día
+_TRIPPED_TTL_SECONDS = 24 * 60 * 60
+
+
+class ValkeyCircuitBreaker(CircuitBreaker):
+    """Implementación de CircuitBreaker sobre Valkey (Redis-compatible)."""
+
+    def __init__(
+        self,
+        valkey_client: Any,
+        failure_threshold: int = 3,
+        cooldown_seconds: int = 60,
+        failure_window_seconds: int = 300,
+        probe_timeout_seconds: int = 60,
+    ) -> None:
+        """Inicializa el circuit breaker.
+
+        Args:
+            valkey_client: Cliente Valkey/Redis async (ej: redis.asyncio.Redis)
+            failure_threshold: Fallos consecutivos que abren el breaker
+            cooldown_seconds: Tiempo en open antes de pasar a half_open
+            failure_window_seconds: Ventana tras la que se olvidan los fallos sueltos
+            probe_timeout_seconds: Vida del lock de la sonda en half_open
+        """
+        self._client = valkey_client
+        self._threshold = failure_threshold
+        self._cooldown = cooldown_seconds
+        self._failure_window = failure_window_seconds
+        self._probe_timeout = probe_timeout_seconds
+
+    @staticmethod
+    def _key(server_id: str, suffix: str) -> str:
+        return f"circuit:{server_id}:{suffix}"
+
+    async def before_call(self, server_id: str) -> None:
+        """Lanza ServerCircuitOpenError si el breaker está abierto o ya hay una sonda."""
+        try:
+            remaining = await self._client.ttl(self._key(server_id, "open"))
+            if remaining is not None and remaining > 0:
+                raise ServerCircuitOpenError(server_id, retry_after=int(remaining))
+            if not await self._client.exists(self._key(server_id, "tripped")):
+                return
+            # half_open: solo una réplica/llamada sondea el servidor
+            acquired = await self._client.set(
+                self._key(server_id, "probe"), "1", nx=True, ex=self._probe_timeout
+            )
+            if not acquired:
+                raise ServerCircuitOpenError(
+                    server_id, retry_after=self._probe_timeout, state=CIRCUIT_HALF_OPEN
+                )
+        except ServerCircuitOpenError:
+            raise
+        except Exception as exc:
+            logger.warning("circuit_breaker_unavailable", server_id=server_id, error=str(exc))
+
+    async def record_success(self, server_id: str) -> None:
+        """Cierra el breaker y olvida los fallos."""
+        try:
+            closed = await self._client.delete(
+                self._key(server_id, "failures"),
+                self._key(server_id, "open"),
+                self._key(server_id, "tripped"),
+                self._key(server_id, "probe"),
+            )
+            if closed:
+                logger.debug("circuit_breaker_closed", server_id=server_id)
+        except Exception as exc:
+            logger.warning("circuit_breaker_unavailable", server_id=server_id, error=str(exc))
+
+    async def record_failure(self, server_id: str) -> None:
+        """Cuenta el fallo y abre (o reabre tras una sonda fallida) el breaker."""
+        try:
+            if await self._client.exists(self._key(server_id, "tripped")):
+                await self._open(server_id)
+                return
+
+            failures_key = self._key(server_id, "failures")
+            failures = await self._client.incr(failures_key)
+            if failures == 1:
+                await self._client.expire(failures_key, self._failure_window)
+            if failures >= self._threshold:
+                await self._open(server_id)
+        except Exception as exc:
+            logger.warning("circuit_breaker_unavailable", server_id=server_id, error=str(exc))
+
+    async def get_state(self, server_id: str) -> str:
+        """Devuelve closed, open o half_open (closed si Valkey no responde)."""
+        try:
+            if await self._client.exists(self._key(server_id, "open")):
+                return CIRCUIT_OPEN
+            if await self._client.exists(self._key(server_id, "tripped")):
+                return CIRCUIT_HALF_OPEN
+        except Exception as exc:
+            logger.warning("circuit_breaker_unavailable", server_id=server_id, error=str(exc))
+        return CIRCUIT_CLOSED
+
+    async def _open(self, server_id: str) -> None:
+        await self._client.set(self._key(server_id, "open"), "1", ex=self._cooldown)
+        await self._client.set(
+            self._key(server_id, "tripped"), "1", ex=_TRIPPED_TTL_SECONDS
+        )
+        await self._client.delete(
+            self._key(server_id, "failures"), self._key(server_id, "probe")
+        )
+        logger.warning(
+            "circuit_breaker_opened", server_id=server_id, cooldown_seconds=self._cooldown
+        )
@@ -0,0 +1,181 @@
+"""InMemoryCredentialCache — Caché de credenciales descifradas para ConnectionFactory.
+
+Evita repetir en cada ConnectionFactory.create() la consulta a BD, los dos
+descifrados AES-GCM del repositorio y el parseo de la clave privada PEM que
+asyncssh haría en cada connect. Es acotada (LRU), con TTL, y se invalida con
+los eventos CredentialUpdated / CredentialDeleted.
+
+Los secretos se guardan en bytearray y se sobrescriben con ceros al expulsar
+la entrada. Las copias str que entrega `password` / `private_key` son
+inmutables y no se pueden borrar: viven solo lo que dure el adaptador.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+import asyncssh
+
+from app.v1.servers.application.interfaces.credential_cache import CredentialCache
+from app.v1.servers.domain.entities.credential import Credential
+
+CredentialLoader = Callable[[], Awaitable[Credential | None]]
+
+
+@dataclass(eq=False)
+class CachedCredential:
+    """Credencial descifrada lista para construir un SSHConnectionAdapter."""
+
+    credential_id: str
+    user_id: str
+    username: str | None
+    # "<id>@<updated_at>" — identifica la versión en la clave del SSHConnectionPool
+    version: str
+    expires_at: float
+    client_key: asyncssh.SSHKey | None = None
+    _password: bytearray | None = field(default=None, repr=False)
+    _private_key: bytearray | None = field(default=None, repr=False)
+
+    @property
+    def password(self) -> str | None:
+        return self._password.decode() if self._password is not None else None
+
+    @property
+    def private_key(self) -> str | None:
+        return self._private_key.decode() if self._private_key is not None else None
+
+    def wipe(self) -> None:
+        """Sobrescribe los secretos con ceros y suelta la clave parseada."""
+        for secret in (self._password, self._private_key):
+            if secret is not None:
+                secret[:] = bytes(len(secret))
+        self._password = None
+        self._private_key = None
+        self.client_key = None
+
+
+def _secret(value: str | None) -> bytearray | None:
+    return bytearray(value.encode()) if value is not None else None
+
+
+def _import_key(pem: str | None) -> asyncssh.SSHKey | None:
+    """Parsea la clave PEM una sola vez. None si no hay clave o no es válida."""
+    if pem is None:
+        return None
+    try:
+        return asyncssh.import_private_key(pem)
+    except (asyncssh.KeyImportError, ValueError):
+        # El adaptador reintentará el import en el connect y reportará el error
+        return None
+
+
+class InMemoryCredentialCache(CredentialCache):
+    """Caché LRU con TTL de credenciales descifradas y claves SSH ya importadas."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Inicializa la caché.
+
+        Args:
+            ttl_seconds: Vida máxima de una entrada. Acota cuánto puede tardar en
+                verse un cambio hecho por otro proceso (los eventos son in-process).
+            max_entries: Número máximo de credenciales cacheadas (LRU).
+            clock: Reloj monotónico (inyectable para tests).
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, CachedCredential] = OrderedDict()
+        self._loading: dict[tuple[str, str], asyncio.Future] = {}
+        # Se incrementa en cada invalidación: una carga que empezó antes no se guarda
+        self._epoch = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(
+        self, credential_id: str, user_id: str, loader: CredentialLoader
+    ) -> CachedCredential | None:
+        """Devuelve la credencial cacheada o la carga con `loader`.
+
+        Las cargas concurrentes de la misma credencial se agrupan en una sola
+        llamada a `loader`.
+
+        Args:
+            credential_id: ID de la credencial.
+            user_id: Usuario propietario — una entrada de otro usuario no se devuelve.
+            loader: Corrutina que obtiene la credencial del repositorio.
+
+        Returns:
+            CachedCredential, o None si la credencial no existe para ese usuario.
+        """
+        entry = self._entries.get(credential_id)
+        if entry is not None and entry.expires_at > self._clock():
+            if entry.user_id != user_id:
+                return None
+            self._entries.move_to_end(credential_id)
+            return entry
+
+        flight_key = (credential_id, user_id)
+        pending = self._loading.get(flight_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load(credential_id, loader))
+            self._loading[flight_key] = pending
+            pending.add_done_callback(lambda _: self._loading.pop(flight_key, None))
+        return await asyncio.shield(pending)
+
+    async def _load(
+        self, credential_id: str, loader: CredentialLoader
+    ) -> CachedCredential | None:
+        epoch = self._epoch
+        credential = await loader()
+        if credential is None:
+            self.invalidate(credential_id)
+            return None
+
+        version = f"{credential.id}@{credential.updated_at.isoformat()}"
+        stale = self._entries.pop(credential_id, None)
+        # Misma versión que la entrada caducada: reutiliza la clave ya parseada
+        client_key = (
+            stale.client_key
+            if stale is not None and stale.version == version and stale.client_key is not None
+            else _import_key(credential.private_key)
+        )
+        entry = CachedCredential(
+            credential_id=credential.id,
+            user_id=credential.user_id,
+            username=credential.username,
+            version=version,
+            expires_at=self._clock() + self._ttl,
+            client_key=client_key,
+            _password=_secret(credential.password),
+            _private_key=_secret(credential.private_key),
+        )
+        if stale is not None:
+            stale.wipe()
+
+        if epoch == self._epoch:
+            self._entries[credential_id] = entry
+            while len(self._entries) > self._max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                evicted.wipe()
+        return entry
+
+    def invalidate(self, credential_id: str) -> None:
+        """Descarta la entrada de la credencial y borra sus secretos."""
+        self._epoch += 1
+        entry = self._entries.pop(credential_id, None)
+        if entry is not None:
+            entry.wipe()
+
+    def clear(self) -> None:
+        """Descarta todas las entradas borrando sus secretos."""
+        self._epoch += 1
+        while self._entries:
+            _, entry = self._entries.popitem()
+            entry.wipe()
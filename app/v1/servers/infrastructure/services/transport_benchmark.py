@@ -0,0 +1,107 @@
+"""Micro-benchmark de perfiles de transporte SSH contra un servidor.
+
+Sirve para decidir qué perfil (default, lan, wan) asignar a un host: para cada
+perfil abre una conexión con sus opciones, envía el mismo payload a
+`cat > /dev/null` varias veces y se queda con la ronda más rápida. La primera
+ronda incluye el handshake si no había conexión abierta; quedarse con la mejor
+la deja fuera del throughput.
+
+El payload puede ser compresible (texto repetitivo, como logs o configuración)
+o aleatorio, para ver cuánto aporta o cuesta zlib en cada enlace.
+"""
+import os
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from app.v1.servers.domain.entities.server import Server
+from app.v1.servers.infrastructure.adapters.connection_factory import ConnectionFactory
+from app.v1.servers.infrastructure.adapters.ssh_connection import SSHConnectionAdapter
+from app.v1.servers.infrastructure.adapters.ssh_transport import TRANSPORT_PROFILES
+from app.v1.servers.infrastructure.exceptions import SSHConnectionError
+from app.v1.shared.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+_TEXT_LINE = b"2026-01-01T00:00:00Z INFO ikctl benchmark payload line lorem ipsum dolor\n"
+
+
+@dataclass(frozen=True)
+class TransportBenchmarkResult:
+    """Resultado del benchmark de un perfil de transporte."""
+
+    profile: str
+    payload_bytes: int
+    connect_seconds: float | None = None
+    transfer_seconds: float | None = None
+    throughput_bytes_per_second: float | None = None
+    error: str | None = None
+
+
+def make_payload(size: int, compressible: bool = True) -> bytes:
+    """Genera el payload del benchmark: texto repetitivo o bytes aleatorios."""
+    if not compressible:
+        return os.urandom(size)
+    repeats = size // len(_TEXT_LINE) + 1
+    return (_TEXT_LINE * repeats)[:size]
+
+
+async def benchmark_transport_profiles(
+    connection_factory: ConnectionFactory,
+    server: Server,
+    profiles: Sequence[str] | None = None,
+    payload_bytes: int = 8 * 1024 * 1024,
+    compressible: bool = True,
+    rounds: int = 3,
+) -> list[TransportBenchmarkResult]:
+    """Mide el throughput de subida de cada perfil de transporte contra `server`.
+
+    Args:
+        connection_factory: Factory con la que se crean las conexiones.
+        server: Servidor remote contra el que medir.
+        profiles: Nombres de perfil a medir (default: todos).
+        payload_bytes: Tamaño del payload de cada ronda.
+        compressible: Payload de texto repetitivo (True) o aleatorio (False).
+        rounds: Rondas por perfil; se informa la más rápida.
+
+    Returns:
+        Un TransportBenchmarkResult por perfil, en el orden pedido. Un perfil
+        que no conecta se devuelve con `error` en lugar de abortar el resto.
+    """
+    payload = make_payload(payload_bytes, compressible)
+    results = []
+    for name in profiles or list(TRANSPORT_PROFILES):
+        connection = await connection_factory.create(server, transport_profile=name)
+        try:
+            if not isinstance(connection, SSHConnectionAdapter):
+                raise SSHConnectionError("El benchmark de transporte solo aplica a servidores remote")
+
+            started = time.perf_counter()
+            await connection.execute("true")
+            connect_seconds = time.perf_counter() - started
+
+            best = min([await connection.measure_upload(payload) for _ in range(max(rounds, 1))])
+            results.append(TransportBenchmarkResult(
+                profile=name,
+                payload_bytes=payload_bytes,
+                connect_seconds=connect_seconds,
+                transfer_seconds=best,
+                throughput_bytes_per_second=payload_bytes / best if best > 0 else None,
+            ))
+        except SSHConnectionError as exc:
+            results.append(TransportBenchmarkResult(
+                profile=name, payload_bytes=payload_bytes, error=str(exc)
+            ))
+        finally:
+            await connection.close()
+
+    logger.info(
+        "transport_benchmark_completed",
+        server_id=server.id,
+        payload_bytes=payload_bytes,
+        compressible=compressible,
+        results={
+            r.profile: round(r.throughput_bytes_per_second or 0) for r in results
+        },
+    )
+    return results
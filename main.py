@@ -53,6 +53,13 @@ from app.v1.servers.infrastructure.repositories.group_repository import (
     SQLAlchemyGroupRepository,
 )
 from app.v1.servers.infrastructure.adapters.connection_factory import ConnectionFactory
+from app.v1.servers.infrastructure.adapters.ssh_connect_governor import SSHConnectGovernor
+from app.v1.servers.infrastructure.adapters.ssh_connection_pool import SSHConnectionPool
+from app.v1.servers.infrastructure.services.circuit_breaker import ValkeyCircuitBreaker
+from app.v1.servers.infrastructure.services.credential_cache import InMemoryCredentialCache
+from app.v1.servers.application.handlers.invalidate_credential_cache import (
+    InvalidateCredentialCacheOnCredentialChanged,
+)
 
 # ---------------------------------------------------------------------------
 # Singleton: Settings
@@ -98,6 +105,42 @@ github_oauth = HttpxGitHubOAuth(
 _valkey_client = create_valkey_client(settings.VALKEY_URL)
 rate_limiter = ValkeyRateLimiter(valkey_client=_valkey_client)
 login_attempt_tracker = ValkeyLoginAttemptTracker(valkey_client=_valkey_client)
+circuit_breaker = ValkeyCircuitBreaker(
+    valkey_client=_valkey_client,
+    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    cooldown_seconds=settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    failure_window_seconds=settings.CIRCUIT_BREAKER_FAILURE_WINDOW_SECONDS,
+)
+
+# ---------------------------------------------------------------------------
+# Singleton: pool de conexiones SSH (ADR-003) — drenado en el shutdown
+# ---------------------------------------------------------------------------
+ssh_connection_pool = SSHConnectionPool(
+    idle_timeout=settings.SSH_POOL_IDLE_TIMEOUT_SECONDS,
+    max_connections_per_host=settings.SSH_POOL_MAX_CONNECTIONS_PER_HOST,
+    max_channels_per_connection=settings.SSH_POOL_MAX_CHANNELS_PER_CONNECTION,
+    spill_queue_threshold=settings.SSH_POOL_SPILL_QUEUE_THRESHOLD,
+)
+
+# ---------------------------------------------------------------------------
+# Singleton: governor de handshakes SSH — cola justa por usuario
+# ---------------------------------------------------------------------------
+ssh_connect_governor = SSHConnectGovernor(
+    max_concurrent=settings.SSH_CONNECT_MAX_CONCURRENT,
+    max_per_host=settings.SSH_CONNECT_MAX_PER_HOST,
+    ramp_start=settings.SSH_CONNECT_RAMP_START,
+)
+
+# ---------------------------------------------------------------------------
+# Singleton: caché de credenciales descifradas — invalidada por eventos
+# ---------------------------------------------------------------------------
+credential_cache = InMemoryCredentialCache(
+    ttl_seconds=settings.CREDENTIAL_CACHE_TTL_SECONDS,
+    max_entries=settings.CREDENTIAL_CACHE_MAX_ENTRIES,
+)
+_invalidate_credential_cache = InvalidateCredentialCacheOnCredentialChanged(credential_cache)
+event_bus.subscribe("CredentialUpdated", _invalidate_credential_cache)
+event_bus.subscribe("CredentialDeleted", _invalidate_credential_cache)
 
 # ---------------------------------------------------------------------------
 # DB engine + session factory (Scoped per request)
@@ -171,7 +214,13 @@ def get_connection_factory(
     credential_repo: SQLAlchemyCredentialRepository = Depends(get_credential_repository),
 ) -> ConnectionFactory:
     """Dependencia FastAPI — proporciona una ConnectionFactory con sesión scoped."""
-    return ConnectionFactory(credential_repository=credential_repo)
+    return ConnectionFactory(
+        credential_repository=credential_repo,
+        connection_pool=ssh_connection_pool,
+        credential_cache=credential_cache,
+        connect_governor=ssh_connect_governor,
+        circuit_breaker=circuit_breaker,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -190,8 +239,15 @@ async def lifespan(app: FastAPI):  # noqa: ANN001
     app.state.login_attempt_tracker = login_attempt_tracker
     app.state.session_factory = _session_factory
     app.state.encryption_key = settings.ENCRYPTION_KEY
+    app.state.ssh_connection_pool = ssh_connection_pool
+    app.state.credential_cache = credential_cache
+    app.state.ssh_connect_governor = ssh_connect_governor
+    app.state.circuit_breaker = circuit_breaker
+    await ssh_connection_pool.start()
     yield
     # Shutdown
+    await ssh_connection_pool.close()
+    credential_cache.clear()
     await _engine.dispose()
     await close_valkey_client(_valkey_client)
 
@@ -6,6 +6,7 @@ correctamente el contrato definido en Connection (ABC):
 2. SSHConnectionAdapter implementa los 4 métodos del port
 3. LocalConnectionAdapter implementa los 4 métodos del port
 4. LocalConnectionAdapter.execute devuelve la tupla (rc, stdout, stderr) esperada
+5. Ambos implementan stream() como async generator que termina con el exit_code
 """
 import inspect
 
@@ -19,7 +20,11 @@ from app.v1.servers.infrastructure.adapters.ssh_connection import SSHConnectionA
 # Constantes con los métodos obligatorios del contrato
 # ---------------------------------------------------------------------------
 
-_CONTRACT_METHODS = ("execute", "upload_file", "file_exists", "close")
+_CONTRACT_METHODS = (
+    "execute", "upload_file", "upload_many", "file_exists", "stat_many", "hash_many", "close"
+)
+_STREAMING_METHODS = ("stream",)
+_SESSION_METHODS = ("session",)
 
 
 # ---------------------------------------------------------------------------
@@ -75,3 +80,50 @@ async def test_local_connection_adapter_execute_returns_contract_tuple() -> None
     assert isinstance(stderr, str)
     assert rc == 0
     assert "hello" in stdout
+
+
+@pytest.mark.parametrize("adapter_cls", (SSHConnectionAdapter, LocalConnectionAdapter))
+@pytest.mark.parametrize("method_name", _STREAMING_METHODS)
+def test_adapters_implement_streaming_methods_as_async_generators(adapter_cls, method_name: str) -> None:
+    """Los métodos de streaming del port son async generators en ambos adaptadores."""
+    method = getattr(adapter_cls, method_name)
+    assert inspect.isasyncgenfunction(method), (
+        f"'{method_name}' debe ser un async generator en {adapter_cls.__name__}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_connection_adapter_stream_ends_with_exit_chunk() -> None:
+    """LocalConnectionAdapter.stream emite stdout/stderr etiquetados y termina en 'exit'."""
+    adapter = LocalConnectionAdapter()
+    chunks = [chunk async for chunk in adapter.stream("echo out; echo err >&2; exit 3")]
+
+    assert [chunk.seq for chunk in chunks] == list(range(len(chunks)))
+    assert "".join(c.data for c in chunks if c.stream == "stdout") == "out\n"
+    assert "".join(c.data for c in chunks if c.stream == "stderr") == "err\n"
+    assert chunks[-1].stream == "exit"
+    assert chunks[-1].exit_code == 3
+
+
+@pytest.mark.parametrize("adapter_cls", (SSHConnectionAdapter, LocalConnectionAdapter))
+@pytest.mark.parametrize("method_name", _SESSION_METHODS)
+def test_adapters_implement_session_methods_as_context_managers(adapter_cls, method_name: str) -> None:
+    """Los métodos de sesión del port devuelven un async context manager en ambos adaptadores."""
+    method = getattr(adapter_cls, method_name)
+    assert not getattr(method, "__isabstractmethod__", False), (
+        f"'{method_name}' no está implementado en {adapter_cls.__name__}"
+    )
+    assert inspect.isasyncgenfunction(inspect.unwrap(method)), (
+        f"'{method_name}' debe ser un @asynccontextmanager en {adapter_cls.__name__}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_connection_adapter_session_executes_commands() -> None:
+    """LocalConnectionAdapter.session entrega una ShellSession con el contrato de execute."""
+    adapter = LocalConnectionAdapter()
+    async with adapter.session() as shell:
+        rc, stdout, _ = await shell.execute("echo hello")
+
+    assert rc == 0
+    assert stdout == "hello\n"
@@ -0,0 +1,22 @@
+"""Tests para el Value Object TransportProfile."""
+import pytest
+
+from app.v1.servers.domain.value_objects.transport_profile import TransportProfile
+from app.v1.servers.domain.exceptions.server import InvalidTransportProfileError
+
+
+class TestTransportProfile:
+    """Tests para el Value Object TransportProfile (default | lan | wan)."""
+
+    def test_transport_profile_defaults_to_default(self):
+        """Sin valor explícito el perfil es default."""
+        assert TransportProfile().value == "default"
+
+    def test_transport_profile_wan_valid(self):
+        """wan es un perfil de transporte válido."""
+        assert TransportProfile("wan").value == "wan"
+
+    def test_transport_profile_invalid_raises_error(self):
+        """Un perfil no permitido lanza InvalidTransportProfileError."""
+        with pytest.raises(InvalidTransportProfileError):
+            TransportProfile("satellite")
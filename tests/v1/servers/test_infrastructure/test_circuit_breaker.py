@@ -0,0 +1,134 @@
+"""Tests para ValkeyCircuitBreaker.
+
+Estrategia: Valkey en memoria con los comandos que usa el breaker — se validan
+las transiciones closed → open → half_open → closed/open sin un Valkey real.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.v1.servers.application.exceptions import ServerCircuitOpenError
+from app.v1.servers.infrastructure.services.circuit_breaker import ValkeyCircuitBreaker
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakeValkey:
+    """Subconjunto en memoria de redis.asyncio.Redis; los TTL se expiran a mano."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    async def ttl(self, key):
+        if key not in self.data:
+            return -2
+        return self.ttls.get(key, -1)
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, "0")) + 1)
+        return int(self.data[key])
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return True
+
+    async def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            removed += int(self.data.pop(key, None) is not None)
+            self.ttls.pop(key, None)
+        return removed
+
+    def expire_now(self, key: str) -> None:
+        self.data.pop(key, None)
+        self.ttls.pop(key, None)
+
+
+async def _trip(breaker: ValkeyCircuitBreaker, server_id: str = "srv-1", times: int = 3) -> None:
+    for _ in range(times):
+        await breaker.record_failure(server_id)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_threshold_and_fails_fast():
+    """Test 1: al alcanzar el umbral de fallos el breaker se abre y before_call falla sin conectar."""
+    breaker = ValkeyCircuitBreaker(_FakeValkey(), failure_threshold=3, cooldown_seconds=60)
+
+    await _trip(breaker, times=2)
+    assert await breaker.get_state("srv-1") == "closed"
+    await breaker.before_call("srv-1")
+
+    await breaker.record_failure("srv-1")
+    assert await breaker.get_state("srv-1") == "open"
+    with pytest.raises(ServerCircuitOpenError) as exc_info:
+        await breaker.before_call("srv-1")
+    assert exc_info.value.retry_after == 60
+    assert exc_info.value.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_half_open_allows_a_single_probe():
+    """Test 2: tras el cool-down solo una llamada sondea el servidor; el resto sigue fallando rápido."""
+    valkey = _FakeValkey()
+    breaker = ValkeyCircuitBreaker(valkey, failure_threshold=3)
+    await _trip(breaker)
+    valkey.expire_now("circuit:srv-1:open")
+
+    assert await breaker.get_state("srv-1") == "half_open"
+    await breaker.before_call("srv-1")
+    with pytest.raises(ServerCircuitOpenError) as exc_info:
+        await breaker.before_call("srv-1")
+    assert exc_info.value.state == "half_open"
+
+
+@pytest.mark.asyncio
+async def test_probe_outcome_closes_or_reopens():
+    """Test 3: una sonda correcta cierra el breaker; una fallida lo reabre de inmediato."""
+    valkey = _FakeValkey()
+    breaker = ValkeyCircuitBreaker(valkey, failure_threshold=3)
+
+    await _trip(breaker)
+    valkey.expire_now("circuit:srv-1:open")
+    await breaker.before_call("srv-1")
+    await breaker.record_failure("srv-1")
+    assert await breaker.get_state("srv-1") == "open"
+
+    valkey.expire_now("circuit:srv-1:open")
+    await breaker.before_call("srv-1")
+    await breaker.record_success("srv-1")
+    assert await breaker.get_state("srv-1") == "closed"
+    await breaker.before_call("srv-1")
+
+
+@pytest.mark.asyncio
+async def test_valkey_outage_lets_calls_through():
+    """Test 4: si Valkey no responde el breaker no bloquea las conexiones."""
+    valkey = AsyncMock()
+    valkey.ttl.side_effect = ConnectionError("valkey down")
+    valkey.exists.side_effect = ConnectionError("valkey down")
+    valkey.incr.side_effect = ConnectionError("valkey down")
+    breaker = ValkeyCircuitBreaker(valkey)
+
+    await breaker.before_call("srv-1")
+    await breaker.record_failure("srv-1")
+    assert await breaker.get_state("srv-1") == "closed"
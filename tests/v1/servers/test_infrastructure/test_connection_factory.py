@@ -9,14 +9,17 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.v1.servers.application.exceptions import ServerCircuitOpenError
 from app.v1.servers.domain.entities.credential import Credential
 from app.v1.servers.domain.entities.server import Server
 from app.v1.servers.domain.value_objects.credential_type import CredentialType
 from app.v1.servers.domain.value_objects.server_status import ServerStatus
 from app.v1.servers.domain.value_objects.server_type import ServerType
+from app.v1.servers.domain.value_objects.transport_profile import TransportProfile
 from app.v1.servers.infrastructure.adapters.connection_factory import ConnectionFactory
 from app.v1.servers.infrastructure.adapters.local_connection import LocalConnectionAdapter
 from app.v1.servers.infrastructure.adapters.ssh_connection import SSHConnectionAdapter
+from app.v1.servers.infrastructure.services.credential_cache import InMemoryCredentialCache
 
 
 # ---------------------------------------------------------------------------
@@ -142,3 +145,56 @@ async def test_create_raises_when_credential_not_found():
 
     with pytest.raises(ValueError, match="missing-cred"):
         await factory.create(server)
+
+
+@pytest.mark.asyncio
+async def test_create_with_credential_cache_hits_repository_once():
+    """Test 5: con caché, varias creaciones para la misma credencial consultan el repositorio una vez."""
+    server = _make_remote_server()
+    mock_repo = MagicMock()
+    mock_repo.find_by_id = AsyncMock(return_value=_make_credential(password="pat"))
+
+    factory = ConnectionFactory(
+        credential_repository=mock_repo, credential_cache=InMemoryCredentialCache()
+    )
+    first = await factory.create(server)
+    second = await factory.create(server)
+
+    mock_repo.find_by_id.assert_awaited_once_with("cred-1", "user-1")
+    assert first._password == second._password == "pat"
+    assert first._pool_key == second._pool_key
+
+
+@pytest.mark.asyncio
+async def test_create_fails_fast_when_circuit_is_open():
+    """Test 6: con el breaker abierto lanza ServerCircuitOpenError sin resolver la credencial."""
+    server = _make_remote_server()
+    mock_repo = MagicMock()
+    mock_repo.find_by_id = AsyncMock()
+    breaker = MagicMock()
+    breaker.before_call = AsyncMock(side_effect=ServerCircuitOpenError("srv-1", retry_after=30))
+
+    factory = ConnectionFactory(credential_repository=mock_repo, circuit_breaker=breaker)
+
+    with pytest.raises(ServerCircuitOpenError):
+        await factory.create(server)
+    mock_repo.find_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_applies_server_transport_profile():
+    """Test 7: el perfil de transporte del servidor llega al adaptador y separa la clave del pool."""
+    mock_repo = MagicMock()
+    mock_repo.find_by_id = AsyncMock(return_value=_make_credential(password="pat"))
+    factory = ConnectionFactory(credential_repository=mock_repo)
+    wan_server = _make_remote_server()
+    wan_server.transport_profile = TransportProfile("wan")
+
+    default_adapter = await factory.create(_make_remote_server())
+    wan_adapter = await factory.create(wan_server)
+    override = await factory.create(wan_server, transport_profile="lan")
+
+    assert default_adapter._transport.name == "default"
+    assert wan_adapter._transport.name == "wan"
+    assert override._transport.name == "lan"
+    assert len({default_adapter._pool_key, wan_adapter._pool_key, override._pool_key}) == 3
@@ -0,0 +1,163 @@
+"""Tests para InMemoryCredentialCache.
+
+Estrategia: loader AsyncMock en lugar del repositorio y reloj inyectado — se
+valida reutilización, TTL, invalidación, límite LRU y borrado de secretos sin
+base de datos.
+"""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import asyncssh
+import pytest
+
+from app.v1.servers.application.handlers.invalidate_credential_cache import (
+    InvalidateCredentialCacheOnCredentialChanged,
+)
+from app.v1.servers.domain.entities.credential import Credential
+from app.v1.servers.domain.events.credential_updated import CredentialUpdated
+from app.v1.servers.domain.value_objects.credential_type import CredentialType
+from app.v1.servers.infrastructure.services.credential_cache import InMemoryCredentialCache
+
+_PRIVATE_KEY = asyncssh.generate_private_key("ssh-ed25519").export_private_key().decode()
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_credential(
+    credential_id: str = "cred-1", updated_at: datetime = datetime(2026, 1, 1)
+) -> Credential:
+    return Credential(
+        id=credential_id,
+        user_id="user-1",
+        name="deploy",
+        type=CredentialType("ssh"),
+        username="root",
+        password="s3cret",
+        private_key=_PRIVATE_KEY,
+        created_at=datetime(2026, 1, 1),
+        updated_at=updated_at,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_hit_skips_loader_and_keeps_parsed_key():
+    """Test 1: una segunda petición no vuelve al repositorio y entrega la clave ya parseada."""
+    cache = InMemoryCredentialCache()
+    loader = AsyncMock(return_value=_make_credential())
+
+    first = await cache.get_or_load("cred-1", "user-1", loader)
+    second = await cache.get_or_load("cred-1", "user-1", loader)
+
+    loader.assert_awaited_once()
+    assert second is first
+    assert isinstance(first.client_key, asyncssh.SSHKey)
+    assert first.password == "s3cret"
+    assert first.version == "cred-1@2026-01-01T00:00:00"
+
+
+@pytest.mark.asyncio
+async def test_entry_for_other_user_is_not_returned():
+    """Test 2: una credencial cacheada no se entrega a un usuario distinto del propietario."""
+    cache = InMemoryCredentialCache()
+    await cache.get_or_load("cred-1", "user-1", AsyncMock(return_value=_make_credential()))
+
+    assert await cache.get_or_load("cred-1", "intruder", AsyncMock()) is None
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_reloads_and_reuses_key_for_same_version():
+    """Test 3: al caducar se recarga; si updated_at no cambió se reutiliza la SSHKey parseada."""
+    clock = _Clock()
+    cache = InMemoryCredentialCache(ttl_seconds=10, clock=clock)
+    loader = AsyncMock(return_value=_make_credential())
+
+    first = await cache.get_or_load("cred-1", "user-1", loader)
+    key = first.client_key
+    clock.now = 11
+    second = await cache.get_or_load("cred-1", "user-1", loader)
+
+    assert loader.await_count == 2
+    assert second.client_key is key
+    # La entrada anterior quedó borrada
+    assert first.password is None and first.client_key is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_wipes_secrets():
+    """Test 4: invalidate sobrescribe con ceros los secretos cacheados."""
+    cache = InMemoryCredentialCache()
+    entry = await cache.get_or_load(
+        "cred-1", "user-1", AsyncMock(return_value=_make_credential())
+    )
+    password_buffer = entry._password
+
+    cache.invalidate("cred-1")
+
+    assert password_buffer == bytearray(len("s3cret"))
+    assert entry.password is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_bound_evicts_least_recently_used():
+    """Test 5: al superar max_entries se expulsa (y borra) la entrada menos usada."""
+    cache = InMemoryCredentialCache(max_entries=1)
+    old = await cache.get_or_load("a", "user-1", AsyncMock(return_value=_make_credential("a")))
+    await cache.get_or_load("b", "user-1", AsyncMock(return_value=_make_credential("b")))
+
+    assert len(cache) == 1
+    assert old.password is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    """Test 6: varias peticiones simultáneas de la misma credencial hacen una sola carga."""
+    cache = InMemoryCredentialCache()
+    release = asyncio.Event()
+
+    async def _slow_load() -> Credential:
+        await release.wait()
+        return _make_credential()
+
+    loader = AsyncMock(side_effect=_slow_load)
+    tasks = [asyncio.create_task(cache.get_or_load("cred-1", "user-1", loader)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    entries = await asyncio.gather(*tasks)
+
+    loader.assert_awaited_once()
+    assert len({id(entry) for entry in entries}) == 1
+
+
+@pytest.mark.asyncio
+async def test_credential_updated_event_invalidates_entry():
+    """Test 7: el handler de CredentialUpdated fuerza la recarga en la siguiente petición."""
+    cache = InMemoryCredentialCache()
+    loader = AsyncMock(side_effect=[
+        _make_credential(), _make_credential(updated_at=datetime(2026, 2, 1)),
+    ])
+    handler = InvalidateCredentialCacheOnCredentialChanged(cache)
+
+    await cache.get_or_load("cred-1", "user-1", loader)
+    await handler.handle(CredentialUpdated("cred-1", "user-1", correlation_id=str(uuid4())))
+    reloaded = await cache.get_or_load("cred-1", "user-1", loader)
+
+    assert reloaded.version == "cred-1@2026-02-01T00:00:00"
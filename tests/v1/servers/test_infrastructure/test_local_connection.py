@@ -4,6 +4,7 @@ Estrategia: mock de asyncio.create_subprocess_shell — sin ejecutar
 procesos reales. Valida el comportamiento del adaptador local:
 timeout, sudo ignorado con warning, shutil.copy2, os.path.exists.
 """
+import hashlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -120,3 +121,35 @@ async def test_upload_file_copies_file_locally():
         await adapter.upload_file("/local/source.sh", "/remote/dest.sh")
 
     mock_copy.assert_called_once_with("/local/source.sh", "/remote/dest.sh")
+
+
+@pytest.mark.asyncio
+async def test_upload_many_copies_in_parallel_and_creates_parents(tmp_path):
+    """Test 7: upload_many copia cada archivo creando los directorios y reporta fallos por archivo."""
+    adapter = LocalConnectionAdapter()
+    source = tmp_path / "source.sh"
+    source.write_text("echo ok")
+    dest = tmp_path / "nested" / "dir" / "dest.sh"
+
+    results = await adapter.upload_many([
+        (str(source), str(dest)),
+        (str(tmp_path / "missing.sh"), str(tmp_path / "other.sh")),
+    ])
+
+    assert dest.read_text() == "echo ok"
+    assert results[0].success and results[0].bytes_transferred == 7
+    assert not results[1].success and results[1].error
+
+
+@pytest.mark.asyncio
+async def test_stat_many_reports_existence_size_and_hash(tmp_path):
+    """Test 8: stat_many devuelve existencia, tamaño, mtime y SHA-256 en el orden pedido."""
+    adapter = LocalConnectionAdapter()
+    present = tmp_path / "script.sh"
+    present.write_text("echo ok")
+
+    stats = await adapter.stat_many([str(present), str(tmp_path / "missing")], sha256=True)
+
+    assert stats[0].exists and stats[0].size == 7
+    assert stats[0].sha256 == hashlib.sha256(b"echo ok").hexdigest()
+    assert stats[1].exists is False and stats[1].sha256 is None
@@ -0,0 +1,122 @@
+"""Tests para SSHConnectGovernor.
+
+Estrategia: slots reservados a mano con tareas asyncio — se valida el límite
+global y por host, la rampa, la cola round-robin entre usuarios y las métricas
+sin abrir conexiones reales.
+"""
+import asyncio
+
+import pytest
+
+from app.v1.servers.infrastructure.adapters.ssh_connect_governor import SSHConnectGovernor
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+async def _hold(governor: SSHConnectGovernor, host: str, user: str, gate: asyncio.Event,
+                served: list[str] | None = None, label: str | None = None) -> None:
+    async with governor.slot(host, user):
+        if served is not None:
+            served.append(label or user)
+        await gate.wait()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_global_limit_starts_at_ramp_start():
+    """Test 1: al arrancar solo se permiten ramp_start handshakes simultáneos."""
+    governor = SSHConnectGovernor(max_concurrent=10, max_per_host=10, ramp_start=2)
+    gate = asyncio.Event()
+    tasks = [asyncio.create_task(_hold(governor, f"h{i}:22", "u", gate)) for i in range(5)]
+    await asyncio.sleep(0)
+
+    assert governor.stats()["in_flight"] == 2
+    assert governor.stats()["queued"] == 3
+
+    gate.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_successful_connects_ramp_up_and_failures_back_off():
+    """Test 2: cada handshake correcto sube el límite en uno; un fallo de red lo reduce a la mitad."""
+    governor = SSHConnectGovernor(max_concurrent=8, ramp_start=2)
+
+    for _ in range(6):
+        async with governor.slot("h:22", "u"):
+            pass
+    assert governor.stats()["limit"] == 8
+
+    with pytest.raises(ConnectionResetError):
+        async with governor.slot("h:22", "u"):
+            raise ConnectionResetError("MaxStartups")
+    assert governor.stats()["limit"] == 4
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit_does_not_block_other_hosts():
+    """Test 3: un host saturado no impide conectar a otro host."""
+    governor = SSHConnectGovernor(max_concurrent=10, max_per_host=1, ramp_start=10)
+    gate = asyncio.Event()
+    busy = [asyncio.create_task(_hold(governor, "bastion:22", "u", gate)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    async with governor.slot("other:22", "u"):
+        assert governor.stats()["in_flight"] == 2
+
+    gate.set()
+    await asyncio.gather(*busy)
+
+
+@pytest.mark.asyncio
+async def test_queue_is_fair_across_users():
+    """Test 4: con cola, los permisos se ceden en round-robin entre usuarios."""
+    governor = SSHConnectGovernor(max_concurrent=1, max_per_host=10, ramp_start=1)
+    blocker = asyncio.Event()
+    first = asyncio.create_task(_hold(governor, "h0:22", "bulk", blocker))
+    await asyncio.sleep(0)
+
+    served: list[str] = []
+    release = asyncio.Event()
+    release.set()
+    bulk = [
+        asyncio.create_task(_hold(governor, f"h{i}:22", "bulk", release, served, f"bulk-{i}"))
+        for i in range(1, 4)
+    ]
+    await asyncio.sleep(0)
+    single = asyncio.create_task(_hold(governor, "x:22", "other", release, served, "other"))
+    await asyncio.sleep(0)
+    assert governor.stats()["queued_by_user"] == {"bulk": 3, "other": 1}
+
+    blocker.set()
+    await asyncio.gather(first, *bulk, single)
+
+    assert served.index("other") <= 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue_and_wait_metrics_are_recorded():
+    """Test 5: un waiter cancelado sale de la cola y las esperas quedan en las métricas."""
+    governor = SSHConnectGovernor(max_concurrent=1, ramp_start=1)
+    gate = asyncio.Event()
+    holder = asyncio.create_task(_hold(governor, "h:22", "u", gate))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_hold(governor, "h:22", "u", gate))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert governor.stats()["queued"] == 0
+
+    gate.set()
+    await holder
+    stats = governor.stats()
+    assert stats["in_flight"] == 0
+    assert stats["waits"] == 1
@@ -0,0 +1,274 @@
+"""Tests para SSHConnectionPool (ADR-003, RNF-03).
+
+Estrategia: conexiones asyncssh simuladas con MagicMock — los tests validan
+reutilización, liveness, límite por host, expiración idle y drenado sin
+necesitar un servidor SSH real.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncssh
+import pytest
+
+from app.v1.servers.infrastructure.adapters.ssh_connection_pool import SSHConnectionPool
+from app.v1.servers.infrastructure.exceptions import SSHConnectionError
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_conn(closed: bool = False) -> MagicMock:
+    conn = MagicMock()
+    conn.is_closed = MagicMock(return_value=closed)
+    conn.close = MagicMock()
+    conn.wait_closed = AsyncMock()
+    return conn
+
+
+def _make_connector(*conns: MagicMock) -> AsyncMock:
+    return AsyncMock(side_effect=list(conns))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_make_key_changes_with_credential_version():
+    """Test 1: la clave incluye server_id y versión de credencial."""
+    key_v1 = SSHConnectionPool.make_key("srv-1", "10.0.0.1", 22, "cred-1@2026-01-01")
+    key_v2 = SSHConnectionPool.make_key("srv-1", "10.0.0.1", 22, "cred-1@2026-02-01")
+
+    assert key_v1.startswith("srv-1|")
+    assert key_v1 != key_v2
+
+
+@pytest.mark.asyncio
+async def test_released_connection_is_reused():
+    """Test 2: una conexión devuelta se reutiliza sin volver a conectar."""
+    pool = SSHConnectionPool()
+    conn = _make_conn()
+    connector = _make_connector(conn)
+
+    async with pool.connection("srv-1|a", connector) as first:
+        pass
+    async with pool.connection("srv-1|a", connector) as second:
+        pass
+
+    assert first is second is conn
+    connector.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_dead_connection_is_replaced_on_acquire():
+    """Test 3: una conexión idle cerrada por el servidor no se reutiliza."""
+    pool = SSHConnectionPool()
+    dead, fresh = _make_conn(), _make_conn()
+    connector = _make_connector(dead, fresh)
+
+    async with pool.connection("srv-1|a", connector):
+        pass
+    dead.is_closed.return_value = True
+
+    async with pool.connection("srv-1|a", connector) as conn:
+        assert conn is fresh
+
+    dead.close.assert_called_once()
+    assert pool.stats()["srv-1|a"]["open"] == 1
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_when_host_limit_reached():
+    """Test 4: sin canales libres ni hueco para conectar, el acquire espera a un release."""
+    pool = SSHConnectionPool(
+        max_connections_per_host=1, max_channels_per_connection=1, acquire_timeout=1
+    )
+    conn = _make_conn()
+    connector = _make_connector(conn)
+
+    entry = await pool.acquire("srv-1|a", connector)
+    waiter = asyncio.create_task(pool.acquire("srv-1|a", connector))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await pool.release("srv-1|a", entry)
+    reused = await waiter
+
+    assert reused.conn is conn
+    connector.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_acquire_raises_when_pool_exhausted():
+    """Test 5: si no se libera ninguna conexión a tiempo se lanza SSHConnectionError."""
+    pool = SSHConnectionPool(
+        max_connections_per_host=1, max_channels_per_connection=1, acquire_timeout=0.01
+    )
+    connector = _make_connector(_make_conn())
+
+    await pool.acquire("srv-1|a", connector)
+
+    with pytest.raises(SSHConnectionError, match="agotado"):
+        await pool.acquire("srv-1|a", connector)
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_frees_slot():
+    """Test 6: un connect fallido no consume hueco del límite por host."""
+    pool = SSHConnectionPool(max_connections_per_host=1)
+    conn = _make_conn()
+    connector = AsyncMock(side_effect=[SSHConnectionError("refused"), conn])
+
+    with pytest.raises(SSHConnectionError):
+        await pool.acquire("srv-1|a", connector)
+    entry = await pool.acquire("srv-1|a", connector)
+
+    assert entry.conn is conn
+
+
+@pytest.mark.asyncio
+async def test_evict_idle_closes_expired_connections():
+    """Test 7: el reaper cierra las conexiones idle más antiguas que idle_timeout."""
+    pool = SSHConnectionPool(idle_timeout=0)
+    conn = _make_conn()
+
+    async with pool.connection("srv-1|a", _make_connector(conn)):
+        pass
+    await asyncio.sleep(0.001)
+    closed = await pool.evict_idle()
+
+    assert closed == 1
+    conn.close.assert_called_once()
+    assert pool.stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_new_credential_version_retires_previous_connections():
+    """Test 8: al cambiar la versión de credencial se cierran las conexiones idle anteriores."""
+    pool = SSHConnectionPool()
+    old, new = _make_conn(), _make_conn()
+
+    async with pool.connection("srv-1|h:22|v1", _make_connector(old)):
+        pass
+    async with pool.connection("srv-1|h:22|v2", _make_connector(new)) as conn:
+        assert conn is new
+
+    old.close.assert_called_once()
+    assert "srv-1|h:22|v1" not in pool.stats()
+
+
+@pytest.mark.asyncio
+async def test_close_drains_idle_and_closes_borrowed_on_release():
+    """Test 9: close() cierra las idle y las prestadas se cierran al devolverse."""
+    pool = SSHConnectionPool(max_channels_per_connection=1, spill_queue_threshold=0)
+    idle, borrowed = _make_conn(), _make_conn()
+    connector = _make_connector(idle, borrowed)
+
+    entry_idle = await pool.acquire("srv-1|a", connector)
+    entry_borrowed = await pool.acquire("srv-1|a", connector)
+    await pool.release("srv-1|a", entry_idle)
+
+    await pool.close()
+    idle.close.assert_called_once()
+    borrowed.close.assert_not_called()
+
+    await pool.release("srv-1|a", entry_borrowed)
+    borrowed.close.assert_called_once()
+
+    with pytest.raises(SSHConnectionError, match="cerrado"):
+        await pool.acquire("srv-1|a", connector)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_share_one_connection():
+    """Test 10: varias operaciones concurrentes se multiplexan sobre la misma conexión."""
+    pool = SSHConnectionPool(max_channels_per_connection=3)
+    conn = _make_conn()
+    connector = _make_connector(conn)
+
+    entries = [await pool.acquire("srv-1|a", connector) for _ in range(3)]
+
+    assert {entry.conn for entry in entries} == {conn}
+    assert pool.stats()["srv-1|a"]["channels"] == 3
+    connector.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_in_arrival_order():
+    """Test 11: con el presupuesto agotado, los canales se ceden en orden FIFO."""
+    pool = SSHConnectionPool(
+        max_channels_per_connection=1, max_connections_per_host=1, acquire_timeout=1
+    )
+    connector = _make_connector(_make_conn())
+    entry = await pool.acquire("srv-1|a", connector)
+    served: list[str] = []
+
+    async def _wait(name: str) -> None:
+        granted = await pool.acquire("srv-1|a", connector)
+        served.append(name)
+        await pool.release("srv-1|a", granted)
+
+    tasks = [asyncio.create_task(_wait(name)) for name in ("first", "second", "third")]
+    await asyncio.sleep(0)
+    assert pool.stats()["srv-1|a"]["waiting"] == 3
+
+    await pool.release("srv-1|a", entry)
+    await asyncio.gather(*tasks)
+
+    assert served == ["first", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_spills_to_second_connection_only_when_queue_is_long():
+    """Test 12: solo se abre otra conexión al host cuando la cola supera el umbral."""
+    pool = SSHConnectionPool(
+        max_channels_per_connection=1, spill_queue_threshold=2, acquire_timeout=1
+    )
+    first, second = _make_conn(), _make_conn()
+    connector = _make_connector(first, second)
+
+    await pool.acquire("srv-1|a", connector)
+    queued = [asyncio.create_task(pool.acquire("srv-1|a", connector)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert connector.await_count == 1
+
+    spilled = await pool.acquire("srv-1|a", connector)
+
+    assert spilled.conn is second
+    assert connector.await_count == 2
+    for task in queued:
+        task.cancel()
+    await asyncio.gather(*queued, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_channel_open_rejection_shrinks_budget():
+    """Test 13: si el servidor rechaza un canal, el presupuesto baja a lo aceptado (MaxSessions)."""
+    pool = SSHConnectionPool(max_channels_per_connection=10)
+    connector = _make_connector(_make_conn())
+    held = [await pool.acquire("srv-1|a", connector) for _ in range(2)]
+
+    with pytest.raises(asyncssh.ChannelOpenError):
+        async with pool.connection("srv-1|a", connector):
+            raise asyncssh.ChannelOpenError(asyncssh.OPEN_ADMINISTRATIVELY_PROHIBITED, "max sessions")
+
+    assert held[0].max_channels == 2
+    assert pool.stats()["srv-1|a"]["channels"] == 2
+
+
+@pytest.mark.asyncio
+async def test_lanes_of_the_same_key_do_not_retire_each_other():
+    """Test 14: el carril comprimido de una clave convive con su carril principal."""
+    pool = SSHConnectionPool()
+    main, bulk = _make_conn(), _make_conn()
+    key = "srv-1|h:22|v1|wan"
+
+    async with pool.connection(key, _make_connector(main)):
+        pass
+    async with pool.connection(SSHConnectionPool.lane_key(key, "zlib"), _make_connector(bulk)):
+        pass
+
+    main.close.assert_not_called()
+    assert pool.stats()[key]["open"] == 1
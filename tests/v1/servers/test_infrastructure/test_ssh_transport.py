@@ -0,0 +1,42 @@
+"""Tests para los perfiles de transporte SSH (SSHTransportProfile).
+
+Estrategia: las opciones generadas se validan contra
+asyncssh.SSHClientConnectionOptions, que rechaza algoritmos desconocidos.
+"""
+import asyncssh
+import pytest
+
+from app.v1.servers.infrastructure.adapters.ssh_transport import (
+    DEFAULT_PROFILE,
+    TRANSPORT_PROFILES,
+    get_transport_profile,
+)
+
+
+def test_default_profile_keeps_asyncssh_defaults():
+    """Test 1: el perfil default no fija ninguna opción y un nombre desconocido cae en él."""
+    assert DEFAULT_PROFILE.connect_options() == {}
+    assert get_transport_profile(None) is DEFAULT_PROFILE
+    assert get_transport_profile("unknown") is DEFAULT_PROFILE
+
+
+@pytest.mark.parametrize("name", sorted(TRANSPORT_PROFILES))
+def test_profile_options_are_accepted_by_asyncssh(name):
+    """Test 2: las opciones de cada perfil (comprimidas o no) son válidas para asyncssh."""
+    profile = TRANSPORT_PROFILES[name]
+    for compressed in (False, True):
+        asyncssh.SSHClientConnectionOptions(
+            known_hosts=None, **profile.connect_options(compressed)
+        )
+
+
+def test_auto_compression_only_for_large_payloads():
+    """Test 3: wan comprime solo a partir de compression_min_bytes; lan nunca."""
+    wan, lan = TRANSPORT_PROFILES["wan"], TRANSPORT_PROFILES["lan"]
+
+    assert not wan.compresses(wan.compression_min_bytes - 1)
+    assert wan.compresses(wan.compression_min_bytes)
+    assert wan.connect_options()["compression_algs"] == ["none"]
+    assert wan.connect_options(compressed=True)["compression_algs"][0] == "zlib@openssh.com"
+    assert not lan.compresses(10**9)
+    assert lan.connect_options(compressed=True)["compression_algs"] == ["none"]
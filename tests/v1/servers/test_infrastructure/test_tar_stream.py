@@ -0,0 +1,49 @@
+"""Tests para iter_tar_gz (modo tar de upload_many).
+
+Estrategia: archivos reales en tmp_path — se valida que el stream produce un
+tar.gz válido con los nombres relativos pedidos y que abandonarlo a mitad no
+deja el hilo productor bloqueado.
+"""
+import asyncio
+import io
+import tarfile
+
+import pytest
+
+from app.v1.servers.infrastructure.adapters.tar_stream import iter_tar_gz
+
+
+@pytest.mark.asyncio
+async def test_iter_tar_gz_builds_archive_with_given_names(tmp_path):
+    """Test 1: el stream concatenado es un tar.gz con cada archivo bajo su arcname."""
+    (tmp_path / "a.sh").write_text("echo a")
+    (tmp_path / "b.conf").write_text("key=value")
+
+    data = b"".join([chunk async for chunk in iter_tar_gz([
+        (str(tmp_path / "a.sh"), "bin/a.sh"),
+        (str(tmp_path / "b.conf"), "etc/b.conf"),
+    ])])
+
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+        assert tar.getnames() == ["bin/a.sh", "etc/b.conf"]
+        assert tar.extractfile("bin/a.sh").read() == b"echo a"
+
+
+@pytest.mark.asyncio
+async def test_iter_tar_gz_raises_when_local_file_is_missing(tmp_path):
+    """Test 2: un archivo local inexistente se propaga como OSError."""
+    with pytest.raises(OSError):
+        async for _ in iter_tar_gz([(str(tmp_path / "missing"), "missing")]):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_iter_tar_gz_stops_producer_when_consumer_aborts(tmp_path):
+    """Test 3: si el consumidor abandona el stream, el hilo productor termina."""
+    payload = tmp_path / "big.bin"
+    payload.write_bytes(bytes(range(256)) * 40_000)
+
+    stream = iter_tar_gz([(str(payload), "big.bin")] * 4)
+    await stream.__anext__()
+
+    await asyncio.wait_for(stream.aclose(), timeout=5)
@@ -0,0 +1,58 @@
+"""Tests para benchmark_transport_profiles.
+
+Estrategia: ConnectionFactory simulada que devuelve adaptadores SSH con
+measure_upload parcheado — se valida el orden de perfiles, el uso de la mejor
+ronda y que un perfil que no conecta no aborta el resto.
+"""
+import zlib
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.v1.servers.infrastructure.adapters.ssh_connection import SSHConnectionAdapter
+from app.v1.servers.infrastructure.exceptions import SSHConnectionError
+from app.v1.servers.infrastructure.services.transport_benchmark import (
+    benchmark_transport_profiles,
+    make_payload,
+)
+
+
+def _make_connection(durations=(), error: Exception | None = None) -> SSHConnectionAdapter:
+    connection = SSHConnectionAdapter(host="10.0.0.1")
+    connection.execute = AsyncMock(side_effect=error, return_value=(0, "", ""))
+    connection.measure_upload = AsyncMock(side_effect=list(durations))
+    connection.close = AsyncMock()
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_benchmark_reports_best_round_per_profile():
+    """Test 1: cada perfil informa su ronda más rápida y un fallo de conexión queda como error."""
+    lan = _make_connection(durations=(2.0, 0.5, 1.0))
+    wan = _make_connection(error=SSHConnectionError("timeout"))
+    factory = MagicMock()
+    factory.create = AsyncMock(side_effect=[lan, wan])
+    server = MagicMock(id="srv-1")
+
+    results = await benchmark_transport_profiles(
+        factory, server, profiles=["lan", "wan"], payload_bytes=1000
+    )
+
+    assert [call.kwargs["transport_profile"] for call in factory.create.call_args_list] == [
+        "lan", "wan",
+    ]
+    assert results[0].transfer_seconds == 0.5
+    assert results[0].throughput_bytes_per_second == 2000
+    assert results[1].error == "timeout" and results[1].throughput_bytes_per_second is None
+    lan.close.assert_awaited_once()
+    wan.close.assert_awaited_once()
+
+
+def test_make_payload_compressible_or_random():
+    """Test 2: el payload tiene el tamaño pedido; el de texto comprime y el aleatorio no."""
+    text = make_payload(10_000)
+    noise = make_payload(10_000, compressible=False)
+
+    assert len(text) == len(noise) == 10_000
+    assert len(zlib.compress(text)) < len(text) // 10
+    assert len(zlib.compress(noise)) > len(noise) * 0.9
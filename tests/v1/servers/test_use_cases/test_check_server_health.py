@@ -7,6 +7,7 @@ from app.v1.servers.domain.entities.server import Server
 from app.v1.servers.domain.value_objects.server_type import ServerType
 from app.v1.servers.domain.value_objects.server_status import ServerStatus
 from app.v1.servers.domain.exceptions.server import ServerNotFoundError
+from app.v1.servers.application.exceptions import ServerCircuitOpenError
 from app.v1.servers.application.queries.check_server_health import CheckServerHealth
 from app.v1.servers.application.dtos.health_check_result import HealthCheckResult
 
@@ -104,6 +105,27 @@ class TestCheckServerHealthSuccess:
         assert result.status == "offline"
         assert result.latency_ms is None
 
+    @pytest.mark.asyncio
+    async def test_open_circuit_returns_offline_with_breaker_state(self):
+        """Test 5: Con el circuit breaker abierto devuelve offline y circuit_state sin conectar."""
+        server_repo = AsyncMock()
+        server_repo.find_by_id.return_value = make_server()
+
+        connection_factory = MagicMock()
+        connection_factory.create = AsyncMock(
+            side_effect=ServerCircuitOpenError("srv-123", retry_after=42)
+        )
+
+        use_case = CheckServerHealth(
+            server_repository=server_repo,
+            connection_factory=connection_factory,
+        )
+
+        result = await use_case.execute(user_id="user-123", server_id="srv-123")
+
+        assert result.status == "offline"
+        assert result.circuit_state == "open"
+
 
 class TestCheckServerHealthError:
     """Tests de error del Use Case CheckServerHealth."""
@@ -126,6 +126,28 @@ class TestUpdateServerSuccess:
 
         repo.update.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_remote_server_sets_transport_profile(self):
+        """Test 5: UpdateServer guarda el perfil de transporte y lo devuelve en el ServerResult."""
+        repo = AsyncMock()
+        repo.find_by_id.return_value = make_remote_server()
+        use_case = UpdateServer(server_repository=repo)
+
+        result = await use_case.execute(
+            user_id="user-123",
+            server_id="srv-123",
+            name="Mi servidor",
+            host=None,
+            port=None,
+            credential_id=None,
+            description=None,
+            correlation_id=CORRELATION_ID,
+            transport_profile="wan",
+        )
+
+        assert result.transport_profile == "wan"
+        assert repo.update.call_args.args[0].transport_profile.value == "wan"
+
 
 class TestUpdateServerError:
     """Tests de error del Use Case UpdateServer."""